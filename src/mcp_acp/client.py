@@ -1,23 +1,75 @@
 """ACP client wrapper for OpenShift CLI operations."""
 
 import asyncio
+import atexit
+import functools
+import io
+import itertools
 import json
+import os
 import re
-import secrets
+import shutil
 import subprocess
-from collections.abc import Callable
+import tempfile
+import time
+from collections import Counter
+from collections.abc import Awaitable, Callable, Iterable, Iterator, Mapping
 from datetime import datetime, timedelta
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
+from urllib.parse import unquote_plus
 
+import aiohttp
 import yaml
 
 from mcp_acp.settings import Settings, load_clusters_config, load_settings
 from utils.pylogger import get_python_logger
 
+try:
+    from yaml import CSafeDumper as _YamlDumper
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as _YamlDumper
+    from yaml import SafeLoader as _YamlLoader
+
 # Initialize structured logger
 logger = get_python_logger()
 
+# Validation patterns, compiled once (\Z rather than $ so a trailing newline can't slip through)
+_DNS1123_RE = re.compile(r"^[a-z0-9]([-a-z0-9]*[a-z0-9])?\Z")
+_LABEL_SELECTOR_RE = re.compile(r"^[a-zA-Z0-9=,_.\-/]+\Z")
+_FIELD_PATH_RE = re.compile(r"^[a-zA-Z0-9_]+(\.[a-zA-Z0-9_]+)*\Z")
+_TIMEDELTA_RE = re.compile(r"(\d+)([dhm])")
+_REPO_URL_BAD_CHARS_RE = re.compile(r"[;|&$`\s]")
+
+# Characters rejected in oc arguments (checked with a single C-level set scan per argument)
+_SHELL_METACHARACTERS = frozenset(";|&$`\n\r")
+
+
+def _return_on_error(error_key: str, **error_fields: Any) -> Callable:
+    """Turn any exception raised by an async client method into its error result dict.
+
+    Args:
+        error_key: Result key that receives the exception message
+        **error_fields: Fixed fields of the error result (e.g. created=False)
+
+    Returns:
+        Decorator for async methods returning dict results
+    """
+
+    def decorator(method: Callable[..., Awaitable[dict[str, Any]]]) -> Callable[..., Awaitable[dict[str, Any]]]:
+        @functools.wraps(method)
+        async def wrapper(*args: Any, **kwargs: Any) -> dict[str, Any]:
+            try:
+                return await method(*args, **kwargs)
+            except Exception as e:
+                return {**error_fields, error_key: str(e)}
+
+        return wrapper
+
+    return decorator
+
 
 class ACPClient:
     """Client for interacting with ACP via OpenShift CLI.
@@ -25,7 +77,7 @@ class ACPClient:
     Attributes:
         settings: Global settings instance
         clusters_config: Cluster configuration instance
-        config: Raw cluster configuration (for backward compatibility)
+        config: Raw cluster configuration, read-only (for backward compatibility)
     """
 
     # Security constants
@@ -34,6 +86,29 @@ class ACPClient:
     LABEL_PREFIX = "acp.ambient-code.ai/label-"  # Label prefix for ACP labels
     MAX_COMMAND_TIMEOUT = 120  # Maximum command timeout in seconds
     MAX_LOG_LINES = 10000  # Maximum log lines to retrieve
+    MAX_LOG_BYTES = 10 * 1024 * 1024  # Maximum log bytes to retrieve (10MB)
+    # Merge patches for starting/stopping sessions (static, so serialised once)
+    PATCH_START = json.dumps({"spec": {"stopped": False}}, separators=(",", ":"))
+    PATCH_STOP = json.dumps({"spec": {"stopped": True}}, separators=(",", ":"))
+    # REST collection paths used when reads go through the API proxy
+    API_RESOURCE_PATHS = {
+        "agenticsession": "/apis/vteam.ambient-code/v1alpha1/namespaces/{namespace}/agenticsessions",
+        "pods": "/api/v1/namespaces/{namespace}/pods",
+        "event": "/api/v1/namespaces/{namespace}/events",
+    }
+    API_PROXY_START_TIMEOUT = 10  # Seconds to wait for 'oc proxy' to open its socket
+    # Fields needed to filter, sort and display session lists (displayName last: it's free text)
+    SESSION_LIST_FIELDS = (
+        "metadata.name",
+        "metadata.creationTimestamp",
+        "status.phase",
+        "status.stoppedAt",
+        "spec.displayName",
+    )
+    # oc verbs that change resources or the active cluster, invalidating cached reads
+    CACHE_INVALIDATING_VERBS = frozenset({"apply", "create", "delete", "label", "login", "logout", "patch"})
+    MAX_CACHE_ENTRIES = 256  # Least recently stored cached reads are evicted beyond this
+    MAX_WORKFLOW_CHECKOUTS = 8  # Least recently used workflow repo checkouts are deleted beyond this
 
     def __init__(self, config_path: str | None = None, settings: Settings | None = None):
         """Initialize ACP client.
@@ -56,8 +131,8 @@ class ACPClient:
             logger.error("cluster_config_load_failed", error=str(e))
             raise
 
-        # Backward compatibility: expose raw config
-        self.config = {
+        # Backward compatibility: raw config, exposed read-only through the `config` property
+        self._config: dict[str, Any] = {
             "clusters": {
                 name: {
                     "server": cluster.server,
@@ -69,6 +144,29 @@ class ACPClient:
             "default_cluster": self.clusters_config.default_cluster,
         }
         self.config_path = str(self.settings.config_path)
+        self._rebuild_cluster_index()
+
+        # Resolve the oc binary once rather than searching PATH on every exec
+        self._oc_bin = shutil.which(self.settings.oc_binary)
+        if self._oc_bin is None:
+            logger.warning("oc_binary_not_found", oc_binary=self.settings.oc_binary)
+            self._oc_bin = self.settings.oc_binary
+
+        # Short-lived cache of successful 'oc get' results, keyed by (resource_type, name, namespace, ...)
+        self._cache: dict[tuple[str, ...], tuple[float, subprocess.CompletedProcess]] = {}
+        self._cache_locks: dict[tuple[str, ...], asyncio.Lock] = {}
+
+        # Optional long-lived 'oc proxy' serving reads over a Unix socket (see _api_get)
+        self._proxy_process: asyncio.subprocess.Process | None = None
+        self._proxy_dir: str | None = None
+        self._http: aiohttp.ClientSession | None = None
+        self._proxy_lock = asyncio.Lock()
+
+        # Workflow repository checkouts reused across list_workflows calls:
+        # repo URL -> (checkout path, monotonic time the remote HEAD was last checked)
+        self._workflow_checkouts: dict[str, tuple[str, float]] = {}
+        self._workflow_lock = asyncio.Lock()
+        self._workflow_cleanup_registered = False
 
         logger.info(
             "acp_client_initialized",
@@ -78,6 +176,37 @@ class ACPClient:
 
     # Note: _load_config and _validate_config removed - now handled by Pydantic settings
 
+    @property
+    def config(self) -> MappingProxyType:
+        """Raw cluster configuration (read-only view, for backward compatibility)."""
+        return self._config_view
+
+    @property
+    def default_project(self) -> str | None:
+        """Default project of the default cluster, or None if either is unset."""
+        return self._default_project
+
+    def _rebuild_cluster_index(self) -> None:
+        """Rebuild views and lookups derived from self._config. Call after changing the cluster config."""
+        clusters = self._config.get("clusters", {})
+        # Views over the live dicts: no copies, and callers can't modify the config behind our back
+        self._config_view = MappingProxyType(
+            {
+                "clusters": MappingProxyType({name: MappingProxyType(c) for name, c in clusters.items()}),
+                "default_cluster": self._config.get("default_cluster"),
+            }
+        )
+        # server -> (cluster name, default project)
+        self._server_to_cluster: dict[str, tuple[str, str | None]] = {}
+        for name, cluster_config in clusters.items():
+            # First match wins, as with the previous linear scan
+            self._server_to_cluster.setdefault(
+                cluster_config.get("server"), (name, cluster_config.get("default_project"))
+            )
+        self._clusters_listing: Mapping[str, Any] | None = None
+        # Resolved once here rather than on every tool call
+        self._default_project: str | None = clusters.get(self._config.get("default_cluster"), {}).get("default_project")
+
     def _validate_input(self, value: str, field_name: str, max_length: int = 253) -> None:
         """Validate input to prevent injection attacks.
 
@@ -94,7 +223,7 @@ class ACPClient:
         if len(value) > max_length:
             raise ValueError(f"{field_name} exceeds maximum length of {max_length}")
         # Validate Kubernetes naming conventions (DNS-1123 subdomain)
-        if not re.match(r"^[a-z0-9]([-a-z0-9]*[a-z0-9])?$", value):
+        if not _DNS1123_RE.match(value):
             raise ValueError(f"{field_name} contains invalid characters. Must match: ^[a-z0-9]([-a-z0-9]*[a-z0-9])?$")
 
     def _validate_bulk_operation(self, items: list[str], operation_name: str) -> None:
@@ -119,6 +248,7 @@ class ACPClient:
         capture_output: bool = True,
         parse_json: bool = False,
         timeout: int | None = None,
+        input: bytes | None = None,
     ) -> subprocess.CompletedProcess | dict[str, Any]:
         """Run an oc command asynchronously with security controls.
 
@@ -127,6 +257,7 @@ class ACPClient:
             capture_output: Whether to capture stdout/stderr
             parse_json: If True, parse stdout as JSON and return dict
             timeout: Command timeout in seconds (default: MAX_COMMAND_TIMEOUT)
+            input: Optional data sent to the command's stdin (e.g. a manifest for '-f -')
 
         Returns:
             CompletedProcess result or parsed JSON dict
@@ -140,53 +271,288 @@ class ACPClient:
             if not isinstance(arg, str):
                 raise ValueError(f"All arguments must be strings, got {type(arg)}")
             # Detect potential command injection
-            if any(char in arg for char in [";", "|", "&", "$", "`", "\n", "\r"]):
+            if not _SHELL_METACHARACTERS.isdisjoint(arg):
                 raise ValueError(f"Argument contains suspicious characters: {arg}")
 
-        cmd = ["oc"] + args
+        # Writes drop cached reads of their namespace once oc has finished (or failed/timed out).
+        # Clearing before the command would let a read issued mid-write re-cache the old state.
+        invalidates = bool(args) and args[0] in self.CACHE_INVALIDATING_VERBS
+        if args and args[0] in ("login", "logout"):
+            # The proxy holds the credentials it started with
+            await self._stop_api_proxy()
+
+        cmd = [self._oc_bin, *args]
         effective_timeout = timeout or self.MAX_COMMAND_TIMEOUT
 
-        if capture_output:
-            try:
-                process = await asyncio.create_subprocess_exec(
-                    *cmd,
-                    stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE,
-                    # Security: Prevent shell injection
-                )
-                stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=effective_timeout)
-                result = subprocess.CompletedProcess(
-                    args=cmd,
-                    returncode=process.returncode or 0,
-                    stdout=stdout,
-                    stderr=stderr,
-                )
+        try:
+            if capture_output:
+                try:
+                    process = await asyncio.create_subprocess_exec(
+                        *cmd,
+                        stdin=asyncio.subprocess.PIPE if input is not None else None,
+                        stdout=asyncio.subprocess.PIPE,
+                        stderr=asyncio.subprocess.PIPE,
+                        # Security: Prevent shell injection
+                    )
+                    stdout, stderr = await asyncio.wait_for(process.communicate(input), timeout=effective_timeout)
+                    result = subprocess.CompletedProcess(
+                        args=cmd,
+                        returncode=process.returncode or 0,
+                        stdout=stdout,
+                        stderr=stderr,
+                    )
 
-                if parse_json and result.returncode == 0:
-                    try:
-                        return json.loads(result.stdout.decode())
-                    except json.JSONDecodeError as e:
-                        raise ValueError(f"Failed to parse JSON response: {e}") from e
+                    if parse_json and result.returncode == 0:
+                        try:
+                            return json.loads(result.stdout)
+                        except json.JSONDecodeError as e:
+                            raise ValueError(f"Failed to parse JSON response: {e}") from e
 
-                return result
-            except TimeoutError:
-                # Kill the process if it times out
+                    return result
+                except TimeoutError:
+                    # Kill the process if it times out
+                    try:
+                        process.kill()
+                        await process.wait()
+                    except Exception:
+                        pass
+                    raise TimeoutError(f"Command timed out after {effective_timeout}s") from None
+            else:
+                # For non-captured output, wait for the exit code directly (no worker thread)
+                process = await asyncio.create_subprocess_exec(*cmd)
                 try:
+                    returncode = await asyncio.wait_for(process.wait(), timeout=effective_timeout)
+                except TimeoutError:
                     process.kill()
                     await process.wait()
-                except Exception:
-                    pass
-                raise TimeoutError(f"Command timed out after {effective_timeout}s") from None
-        else:
-            # For non-captured output, use subprocess.run with timeout
-            try:
-                result = await asyncio.wait_for(
-                    asyncio.to_thread(subprocess.run, cmd, capture_output=False, timeout=effective_timeout),
-                    timeout=effective_timeout + 5,  # Extra buffer
-                )
-                return result
-            except subprocess.TimeoutExpired:
-                raise TimeoutError(f"Command timed out after {effective_timeout}s") from None
+                    raise TimeoutError(f"Command timed out after {effective_timeout}s") from None
+                return subprocess.CompletedProcess(args=cmd, returncode=returncode)
+        finally:
+            if invalidates:
+                self._invalidate_cache(args[args.index("-n") + 1] if "-n" in args[:-1] else None)
+
+    def _invalidate_cache(self, namespace: str | None = None) -> None:
+        """Drop cached read results.
+
+        Args:
+            namespace: Only drop entries for this namespace (default: drop everything)
+        """
+        if namespace is None:
+            self._cache.clear()
+            return
+        for key in [key for key in self._cache if key[2] == namespace]:
+            del self._cache[key]
+
+    async def _cached_get(
+        self,
+        key: tuple[str, ...],
+        fetch: Callable[[], Awaitable[subprocess.CompletedProcess]],
+    ) -> subprocess.CompletedProcess:
+        """Return a cached 'oc get' result, fetching it on a miss.
+
+        Concurrent misses for the same key share a single oc invocation. Only
+        successful results are cached; callers parse the (immutable) stdout bytes
+        themselves, so cached data can't be mutated by a caller.
+
+        Args:
+            key: Cache key (resource_type, name, namespace, ...)
+            fetch: Coroutine function running the oc command
+
+        Returns:
+            CompletedProcess result
+        """
+        ttl = self.settings.cache_ttl_seconds
+        if ttl <= 0:
+            return await fetch()
+
+        entry = self._cache.get(key)
+        if entry and time.monotonic() - entry[0] < ttl:
+            return entry[1]
+
+        lock = self._cache_locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            # Another caller may have filled the entry while we waited
+            entry = self._cache.get(key)
+            if entry and time.monotonic() - entry[0] < ttl:
+                return entry[1]
+
+            result = await fetch()
+            if result.returncode == 0:
+                # Re-insert so dict order tracks recency, then evict from the old end
+                self._cache.pop(key, None)
+                self._cache[key] = (time.monotonic(), result)
+                while len(self._cache) > self.MAX_CACHE_ENTRIES:
+                    evicted = next(iter(self._cache))
+                    del self._cache[evicted]
+                    if evicted in self._cache_locks and not self._cache_locks[evicted].locked():
+                        del self._cache_locks[evicted]
+            return result
+
+    async def _ensure_api_proxy(self) -> aiohttp.ClientSession:
+        """Start 'oc proxy' on a private Unix socket if needed and return an HTTP session for it.
+
+        The proxy reuses oc's current login (token, TLS) and keeps connections to the API
+        server alive, so each read costs one local HTTP request instead of an oc process.
+
+        Returns:
+            HTTP session bound to the proxy socket
+
+        Raises:
+            RuntimeError: If the proxy fails to start
+        """
+        async with self._proxy_lock:
+            if self._http is not None and self._proxy_process is not None and self._proxy_process.returncode is None:
+                return self._http
+
+            await self._stop_api_proxy_locked()
+
+            # Security: socket lives in a private (0700) directory
+            self._proxy_dir = tempfile.mkdtemp(prefix="acp-proxy-")
+            socket_path = os.path.join(self._proxy_dir, "proxy.sock")
+            self._proxy_process = await asyncio.create_subprocess_exec(
+                self._oc_bin,
+                "proxy",
+                f"--unix-socket={socket_path}",
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.DEVNULL,
+            )
+
+            deadline = time.monotonic() + self.API_PROXY_START_TIMEOUT
+            while not os.path.exists(socket_path):
+                if self._proxy_process.returncode is not None or time.monotonic() > deadline:
+                    await self._stop_api_proxy_locked()
+                    raise RuntimeError("oc proxy failed to start")
+                await asyncio.sleep(0.05)
+
+            self._http = aiohttp.ClientSession(connector=aiohttp.UnixConnector(path=socket_path))
+            logger.info("api_proxy_started", socket=socket_path)
+            return self._http
+
+    async def _stop_api_proxy(self) -> None:
+        """Stop the API proxy and close its HTTP session, if running.
+
+        Serialized with _ensure_api_proxy, so a proxy is never started while another is being torn down.
+        """
+        async with self._proxy_lock:
+            await self._stop_api_proxy_locked()
+
+    async def _stop_api_proxy_locked(self) -> None:
+        """Stop the API proxy. The caller must hold self._proxy_lock."""
+        if self._http is not None:
+            await self._http.close()
+            self._http = None
+        if self._proxy_process is not None:
+            if self._proxy_process.returncode is None:
+                self._proxy_process.terminate()
+                await self._proxy_process.wait()
+            self._proxy_process = None
+        if self._proxy_dir is not None:
+            shutil.rmtree(self._proxy_dir, ignore_errors=True)
+            self._proxy_dir = None
+
+    async def close(self) -> None:
+        """Release long-lived resources held by the client."""
+        await self._stop_api_proxy()
+
+    async def _api_get(self, path: str, params: dict[str, str] | None = None) -> subprocess.CompletedProcess | None:
+        """GET an API server path through the oc proxy.
+
+        The response is wrapped in a CompletedProcess (args ['GET', path]) so it can be
+        cached and handled like an 'oc get -o json' result.
+
+        Args:
+            path: API path (e.g., '/api/v1/namespaces/ns/pods')
+            params: Optional query parameters
+
+        Returns:
+            CompletedProcess result, or None if the proxy is disabled or unusable
+            (callers then fall back to oc)
+        """
+        return await self._api_request("GET", path, params=params)
+
+    async def _api_merge_patch(self, path: str, patch: str) -> subprocess.CompletedProcess | None:
+        """Apply a JSON merge patch to an API server path through the oc proxy.
+
+        Args:
+            path: API path of the resource
+            patch: Serialised merge patch
+
+        Returns:
+            CompletedProcess result (stdout is the patched resource), or None if the
+            proxy is disabled or unusable (callers then fall back to oc)
+        """
+        return await self._api_request(
+            "PATCH", path, data=patch.encode(), headers={"Content-Type": "application/merge-patch+json"}
+        )
+
+    async def _api_request(
+        self,
+        method: str,
+        path: str,
+        params: dict[str, str] | None = None,
+        data: bytes | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> subprocess.CompletedProcess | None:
+        """Send a request to the API server through the oc proxy.
+
+        Args:
+            method: HTTP method
+            path: API path
+            params: Optional query parameters
+            data: Optional request body
+            headers: Optional request headers
+
+        Returns:
+            CompletedProcess result (args [method, path]), or None if the proxy is
+            disabled or unusable
+        """
+        if not self.settings.use_api_proxy:
+            return None
+
+        try:
+            http = await self._ensure_api_proxy()
+            async with http.request(
+                method,
+                f"http://localhost{path}",
+                params=params,
+                data=data,
+                headers=headers,
+                timeout=aiohttp.ClientTimeout(total=self.MAX_COMMAND_TIMEOUT),
+            ) as response:
+                status = response.status
+                body = await response.read()
+        except (aiohttp.ClientError, OSError, RuntimeError, TimeoutError) as e:
+            logger.warning("api_proxy_request_failed", path=path, error=str(e))
+            return None
+
+        if status == 200:
+            return subprocess.CompletedProcess(args=[method, path], returncode=0, stdout=body, stderr=b"")
+
+        try:
+            message = json.loads(body).get("message", "")
+        except (ValueError, AttributeError):
+            message = body.decode(errors="replace")
+        return subprocess.CompletedProcess(
+            args=[method, path], returncode=1, stdout=b"", stderr=f"Error from server ({status}): {message}".encode()
+        )
+
+    async def _read_resource(
+        self, args: list[str], path: str, params: dict[str, str] | None = None
+    ) -> subprocess.CompletedProcess:
+        """Run a read through the API proxy when enabled, otherwise (or on proxy failure) through oc.
+
+        Args:
+            args: oc arguments for the read
+            path: Equivalent API path
+            params: Query parameters for the API path
+
+        Returns:
+            CompletedProcess result
+        """
+        result = await self._api_get(path, params)
+        if result is None:
+            result = await self._run_oc_command(args)
+        return result
 
     async def _get_resource_json(self, resource_type: str, name: str, namespace: str) -> dict[str, Any]:
         """Get a Kubernetes resource as JSON dict.
@@ -209,15 +575,23 @@ class ACPClient:
         self._validate_input(name, "resource name")
         self._validate_input(namespace, "namespace")
 
-        result = await self._run_oc_command(["get", resource_type, name, "-n", namespace, "-o", "json"])
+        path = self.API_RESOURCE_PATHS[resource_type].format(namespace=namespace) + f"/{name}"
+        result = await self._cached_get(
+            (resource_type, name, namespace),
+            lambda: self._read_resource(["get", resource_type, name, "-n", namespace, "-o", "json"], path),
+        )
 
         if result.returncode != 0:
             raise Exception(f"Failed to get {resource_type} '{name}': {result.stderr.decode()}")
 
-        return json.loads(result.stdout.decode())
+        return json.loads(result.stdout)
 
     async def _list_resources_json(
-        self, resource_type: str, namespace: str, selector: str | None = None
+        self,
+        resource_type: str,
+        namespace: str,
+        selector: str | None = None,
+        fields: tuple[str, ...] | None = None,
     ) -> list[dict[str, Any]]:
         """List Kubernetes resources as JSON dicts.
 
@@ -225,9 +599,35 @@ class ACPClient:
             resource_type: Resource type (e.g., 'agenticsession')
             namespace: Namespace
             selector: Optional label selector
+            fields: Optional dotted field paths to project (see _iter_resources_json)
 
         Returns:
             List of resources as JSON dicts
+        """
+        return list(await self._iter_resources_json(resource_type, namespace, selector, fields))
+
+    async def _iter_resources_json(
+        self,
+        resource_type: str,
+        namespace: str,
+        selector: str | None = None,
+        fields: tuple[str, ...] | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Fetch Kubernetes resources and iterate over them as JSON dicts.
+
+        Projected items are parsed lazily, so callers that stop early (e.g. on a
+        limit) never build dicts for the remaining items.
+
+        Args:
+            resource_type: Resource type (e.g., 'agenticsession')
+            namespace: Namespace
+            selector: Optional label selector
+            fields: Optional dotted field paths (e.g., 'status.phase') to project server-side.
+                Only these fields are transferred, keeping their nesting in the returned dicts.
+                Values come back as strings; empty/missing fields are omitted.
+
+        Returns:
+            Iterator over resources as JSON dicts
 
         Raises:
             ValueError: If inputs are invalid
@@ -237,69 +637,149 @@ class ACPClient:
         if resource_type not in self.ALLOWED_RESOURCE_TYPES:
             raise ValueError(f"Resource type '{resource_type}' not allowed")
         self._validate_input(namespace, "namespace")
-        if selector and not re.match(r"^[a-zA-Z0-9=,_.\-/]+$", selector):
+        if selector and not _LABEL_SELECTOR_RE.match(selector):
             raise ValueError(f"Invalid label selector format: {selector}")
+        for field in fields or ():
+            if not _FIELD_PATH_RE.match(field):
+                raise ValueError(f"Invalid field path: {field}")
+
+        if fields:
+            # One tab-separated line per item instead of the full object dump. Every value is
+            # URL-query-escaped, so tabs/newlines in free text (e.g. displayName) can't split a row;
+            # the nested 'with's skip missing parents instead of failing on them.
+            columns = '{{"\\t"}}'.join(
+                "".join(f"{{{{with .{part}}}}}" for part in field.split("."))
+                + "{{urlquery .}}"
+                + "{{end}}" * (field.count(".") + 1)
+                for field in fields
+            )
+            output = f'go-template={{{{range .items}}}}{columns}{{{{"\\n"}}}}{{{{end}}}}'
+        else:
+            output = "json"
 
-        args = ["get", resource_type, "-n", namespace, "-o", "json"]
+        args = ["get", resource_type, "-n", namespace, "-o", output]
         if selector:
             args.extend(["-l", selector])
 
-        result = await self._run_oc_command(args)
+        path = self.API_RESOURCE_PATHS[resource_type].format(namespace=namespace)
+        params = {"labelSelector": selector} if selector else None
+        result = await self._cached_get(
+            (resource_type, "", namespace, selector or "", ",".join(fields or ())),
+            lambda: self._read_resource(args, path, params),
+        )
 
         if result.returncode != 0:
             raise Exception(f"Failed to list {resource_type}: {result.stderr.decode()}")
 
-        data = json.loads(result.stdout.decode())
-        return data.get("items", [])
+        # The API proxy returns full objects (a superset of any projection)
+        if fields and result.args[0] != "GET":
+            return self._iter_projected_items(result.stdout.decode(), fields)
 
-    async def _validate_session_for_dry_run(self, project: str, session: str, operation: str) -> dict[str, Any]:
-        """Validate session exists for dry-run and return session info.
+        data = json.loads(result.stdout)
+        return iter(data.get("items", []))
+
+    @staticmethod
+    def _iter_projected_items(output: str, fields: tuple[str, ...]) -> Iterator[dict[str, Any]]:
+        """Parse tab-separated, URL-query-escaped projection output back into nested dicts.
+
+        Args:
+            output: oc output with one line per item and one escaped column per field
+            fields: Dotted field paths, in column order
+
+        Yields:
+            Dicts shaped like the original resources
+        """
+
+        def build(columns: list[str]) -> dict[str, Any]:
+            item: dict[str, Any] = {}
+            for field, value in zip(fields, columns, strict=True):
+                if not value:
+                    continue
+                *parents, leaf = field.split(".")
+                node = item
+                for parent in parents:
+                    node = node.setdefault(parent, {})
+                node[leaf] = unquote_plus(value)
+            return item
+
+        for line in io.StringIO(output):
+            # Escaped values contain no tabs or newlines, so every line is exactly one item
+            columns = line.removesuffix("\n").split("\t")
+            if len(columns) != len(fields):
+                raise ValueError(f"Unexpected projection output: {line!r}")
+            yield build(columns)
+
+    def _dry_run_preview(
+        self, project: str, session: str, operation: str, session_data: dict[str, Any] | None
+    ) -> dict[str, Any]:
+        """Build the dry-run response for a session from already-fetched data.
 
         Args:
             project: Project/namespace name
             session: Session name
             operation: Operation name for message (e.g., "delete", "restart")
+            session_data: Session resource, or None if it wasn't found
 
         Returns:
             Dict with dry_run response including session_info if found
         """
-        try:
-            session_data = await self._get_resource_json("agenticsession", session, project)
-
-            return {
-                "dry_run": True,
-                "success": True,
-                "message": f"Would {operation} session '{session}' in project '{project}'",
-                "session_info": {
-                    "name": session_data.get("metadata", {}).get("name"),
-                    "status": session_data.get("status", {}).get("phase"),
-                    "created": session_data.get("metadata", {}).get("creationTimestamp"),
-                    "stopped_at": session_data.get("status", {}).get("stoppedAt"),
-                },
-            }
-        except Exception:
+        if session_data is None:
             return {
                 "dry_run": True,
                 "success": False,
                 "message": f"Session '{session}' not found in project '{project}'",
             }
 
-    async def _bulk_operation(
+        return {
+            "dry_run": True,
+            "success": True,
+            "message": f"Would {operation} session '{session}' in project '{project}'",
+            "session_info": {
+                "name": session_data.get("metadata", {}).get("name"),
+                "status": session_data.get("status", {}).get("phase"),
+                "created": session_data.get("metadata", {}).get("creationTimestamp"),
+                "stopped_at": session_data.get("status", {}).get("stoppedAt"),
+            },
+        }
+
+    async def _validate_session_for_dry_run(self, project: str, session: str, operation: str) -> dict[str, Any]:
+        """Validate session exists for dry-run and return session info.
+
+        Args:
+            project: Project/namespace name
+            session: Session name
+            operation: Operation name for message (e.g., "delete", "restart")
+
+        Returns:
+            Dict with dry_run response including session_info if found
+        """
+        try:
+            session_data = await self._get_resource_json("agenticsession", session, project)
+        except Exception:
+            session_data = None
+
+        return self._dry_run_preview(project, session, operation, session_data)
+
+    async def _bulk_preview(
         self,
         project: str,
         sessions: list[str],
-        operation_fn: Callable,
+        preview_op: Callable,
         success_key: str,
-        dry_run: bool = False,
+        preview_fn: Callable[[str, dict[str, Any] | None], dict[str, Any]] | None = None,
     ) -> dict[str, Any]:
-        """Generic bulk operation handler.
+        """Build the dry-run response of a bulk session operation.
+
+        Real runs go through _bulk_session_command instead (one oc call for all sessions).
 
         Args:
             project: Project/namespace name
             sessions: List of session names
-            operation_fn: Async function to call for each session
+            preview_op: Async function called as preview_op(project, session, dry_run=True)
             success_key: Key name for successful operations in response
-            dry_run: Preview mode
+            preview_fn: Optional function building the dry-run response from (session, session data or
+                None if not found). When given, all sessions are fetched with a single list call
+                instead of calling preview_op per session.
 
         Returns:
             Standardized bulk operation response
@@ -307,40 +787,103 @@ class ACPClient:
         # Enforce 3-item limit
         self._validate_bulk_operation(sessions, success_key)
 
-        success = []
-        failed = []
+        sessions_by_name = None
+        if preview_fn is not None and len(sessions) > 1:
+            try:
+                listed = await self._list_resources_json("agenticsession", project, fields=self.SESSION_LIST_FIELDS)
+                sessions_by_name = {item.get("metadata", {}).get("name"): item for item in listed}
+            except Exception as e:
+                # Fall back to per-session lookups
+                logger.warning("bulk_dry_run_list_failed", project=project, error=str(e))
+
+        # Per-session lookups are independent, so run them concurrently (bounded to avoid
+        # spawning too many oc processes)
+        semaphore = asyncio.Semaphore(self.settings.bulk_concurrency)
+
+        async def run_one(session: str) -> dict[str, Any]:
+            if sessions_by_name is not None:
+                return preview_fn(session, sessions_by_name.get(session))
+            async with semaphore:
+                return await preview_op(project, session, dry_run=True)
+
+        results = await asyncio.gather(*(run_one(s) for s in sessions), return_exceptions=True)
+
         dry_run_info = {"would_execute": [], "skipped": []}
 
+        for session, result in zip(sessions, results, strict=True):
+            if isinstance(result, BaseException):
+                if not isinstance(result, Exception):
+                    raise result
+                # A failing session must not abort the rest of the batch
+                result = {"success": False, "message": str(result)}
+
+            if result.get("success", True):
+                dry_run_info["would_execute"].append(
+                    {
+                        "session": session,
+                        "info": result.get("session_info"),
+                    }
+                )
+            else:
+                dry_run_info["skipped"].append(
+                    {
+                        "session": session,
+                        "reason": result.get("message"),
+                    }
+                )
+
+        return {success_key: [], "failed": [], "dry_run": True, "dry_run_info": dry_run_info}
+
+    async def _bulk_session_command(
+        self,
+        project: str,
+        sessions: list[str],
+        verb: str,
+        verb_args: list[str],
+        success_key: str,
+    ) -> dict[str, Any]:
+        """Run a single oc command against several sessions at once.
+
+        oc accepts multiple resource names per invocation, so a bulk operation costs
+        one process instead of one per session. Sessions oc does not report back
+        (e.g. not found) are returned as failed.
+
+        Args:
+            project: Project/namespace name
+            sessions: List of session names
+            verb: oc verb (e.g., 'delete', 'patch')
+            verb_args: Extra arguments for the verb
+            success_key: Key name for successful operations in response
+
+        Returns:
+            Standardized bulk operation response
+        """
+        # Enforce 3-item limit
+        self._validate_bulk_operation(sessions, success_key)
+
+        # Security: Validate inputs (names are passed straight to oc)
+        self._validate_input(project, "project")
         for session in sessions:
-            result = await operation_fn(project, session, dry_run=dry_run)
+            self._validate_input(session, "session")
 
-            if dry_run:
-                if result.get("success", True):
-                    dry_run_info["would_execute"].append(
-                        {
-                            "session": session,
-                            "info": result.get("session_info"),
-                        }
-                    )
-                else:
-                    dry_run_info["skipped"].append(
-                        {
-                            "session": session,
-                            "reason": result.get("message"),
-                        }
-                    )
-            else:
-                if result.get(success_key, result.get("success")):
-                    success.append(session)
-                else:
-                    failed.append({"session": session, "error": result.get("message")})
+        result = await self._run_oc_command(
+            [verb, "agenticsession", *sessions, "-n", project, *verb_args, "-o", "name"]
+        )
 
-        response = {success_key: success, "failed": failed}
-        if dry_run:
-            response["dry_run"] = True
-            response["dry_run_info"] = dry_run_info
+        # '-o name' prints one 'agenticsession.<group>/<name>' line per processed resource
+        done = {line.rsplit("/", 1)[-1] for line in result.stdout.decode().splitlines() if line.strip()}
+        errors = [line for line in result.stderr.decode().splitlines() if line.strip()]
+
+        success = []
+        failed = []
+        for session in sessions:
+            if session in done:
+                success.append(session)
+                continue
+            error = next((line for line in errors if f'"{session}"' in line), None)
+            failed.append({"session": session, "error": error or "\n".join(errors) or "No result reported by oc"})
 
-        return response
+        return {success_key: success, "failed": failed, "dry_run": False}
 
     async def label_resource(
         self,
@@ -464,11 +1007,15 @@ class ACPClient:
         # Enforce limit
         self._validate_bulk_operation(names, "label")
 
+        # Resources are independent, so label them concurrently
+        results = await asyncio.gather(
+            *(self.label_resource(resource_type, name, project, labels, dry_run) for name in names)
+        )
+
         success = []
         failed = []
 
-        for name in names:
-            result = await self.label_resource(resource_type, name, project, labels, dry_run)
+        for name, result in zip(names, results, strict=True):
             if result.get("labeled", result.get("success")):
                 success.append(name)
             else:
@@ -503,11 +1050,15 @@ class ACPClient:
         # Enforce limit
         self._validate_bulk_operation(names, "unlabel")
 
+        # Resources are independent, so unlabel them concurrently
+        results = await asyncio.gather(
+            *(self.unlabel_resource(resource_type, name, project, label_keys, dry_run) for name in names)
+        )
+
         success = []
         failed = []
 
-        for name in names:
-            result = await self.unlabel_resource(resource_type, name, project, label_keys, dry_run)
+        for name, result in zip(names, results, strict=True):
             if result.get("unlabeled", result.get("success")):
                 success.append(name)
             else:
@@ -543,27 +1094,39 @@ class ACPClient:
         Returns:
             Dict with sessions list and metadata
         """
-        sessions = await self._list_resources_json("agenticsession", project, selector=label_selector)
+        sessions = await self._iter_resources_json(
+            "agenticsession", project, selector=label_selector, fields=self.SESSION_LIST_FIELDS
+        )
 
-        # Build filter predicates
-        filters = []
+        # Resolve filter parameters once, outside the per-session loop
         filters_applied = {}
+        status_lower = None
+        cutoff_time = None
 
         if status:
-            filters.append(lambda s: s.get("status", {}).get("phase", "").lower() == status.lower())
+            status_lower = status.lower()
             filters_applied["status"] = status
 
         if has_display_name is not None:
-            filters.append(lambda s: bool(s.get("spec", {}).get("displayName")) == has_display_name)
             filters_applied["has_display_name"] = has_display_name
 
         if older_than:
             cutoff_time = self._parse_time_delta(older_than)
-            filters.append(lambda s: self._is_older_than(s.get("metadata", {}).get("creationTimestamp"), cutoff_time))
             filters_applied["older_than"] = older_than
 
-        # Single-pass filter
-        filtered = [s for s in sessions if all(f(s) for f in filters)]
+        # Single lazy pass with the tests inlined: without sorting, parsing stops as soon as the limit is reached
+        filtered: Iterable[dict[str, Any]] = sessions
+        if filters_applied:
+            filtered = (
+                s
+                for s in sessions
+                if (status_lower is None or s.get("status", {}).get("phase", "").lower() == status_lower)
+                and (has_display_name is None or bool(s.get("spec", {}).get("displayName")) == has_display_name)
+                and (
+                    cutoff_time is None
+                    or self._is_older_than(s.get("metadata", {}).get("creationTimestamp"), cutoff_time)
+                )
+            )
 
         # Sort
         if sort_by:
@@ -572,9 +1135,11 @@ class ACPClient:
 
         # Limit
         if limit and limit > 0:
-            filtered = filtered[:limit]
+            filtered = itertools.islice(filtered, limit)
             filters_applied["limit"] = limit
 
+        filtered = list(filtered)
+
         return {
             "sessions": filtered,
             "total": len(filtered),
@@ -603,7 +1168,7 @@ class ACPClient:
 
         return await self.list_sessions(project=project, label_selector=label_selector, **kwargs)
 
-    def _sort_sessions(self, sessions: list[dict], sort_by: str) -> list[dict]:
+    def _sort_sessions(self, sessions: Iterable[dict], sort_by: str) -> list[dict]:
         """Sort sessions by field.
 
         Args:
@@ -622,7 +1187,7 @@ class ACPClient:
         key_fn = sort_keys.get(sort_by)
         if key_fn:
             return sorted(sessions, key=key_fn, reverse=(sort_by != "name"))
-        return sessions
+        return list(sessions)
 
     def _parse_time_delta(self, time_str: str) -> datetime:
         """Parse time delta string (e.g., '7d', '24h') to datetime.
@@ -633,7 +1198,7 @@ class ACPClient:
         Returns:
             Datetime representing the cutoff time
         """
-        match = re.match(r"(\d+)([dhm])", time_str.lower())
+        match = _TIMEDELTA_RE.match(time_str.lower())
         if not match:
             raise ValueError(f"Invalid time format: {time_str}. Use format like '7d', '24h', '30m'")
 
@@ -662,9 +1227,8 @@ class ACPClient:
         if not timestamp_str:
             return False
 
-        # Parse ISO format timestamp
-        timestamp = datetime.fromisoformat(timestamp_str.replace("Z", "+00:00"))
-        return timestamp.replace(tzinfo=None) < cutoff
+        # Parse ISO format timestamp (fromisoformat accepts the trailing 'Z' since Python 3.11)
+        return datetime.fromisoformat(timestamp_str).replace(tzinfo=None) < cutoff
 
     async def delete_session(self, project: str, session: str, dry_run: bool = False) -> dict[str, Any]:
         """Delete a session.
@@ -705,10 +1269,9 @@ class ACPClient:
             Dict with restart status
         """
         try:
-            session_data = await self._get_resource_json("agenticsession", session, project)
-            current_status = session_data.get("status", {}).get("phase", "unknown")
-
             if dry_run:
+                session_data = await self._get_resource_json("agenticsession", session, project)
+                current_status = session_data.get("status", {}).get("phase", "unknown")
                 return {
                     "status": current_status,
                     "dry_run": True,
@@ -721,19 +1284,13 @@ class ACPClient:
                     },
                 }
 
+            # Security: Validate inputs (no GET first: the patch is idempotent and fails on its own if not found)
+            self._validate_input(project, "project")
+            self._validate_input(session, "session")
+
             # Restart by patching the stopped field to false
-            patch = {"spec": {"stopped": False}}
             result = await self._run_oc_command(
-                [
-                    "patch",
-                    "agenticsession",
-                    session,
-                    "-n",
-                    project,
-                    "--type=merge",
-                    "-p",
-                    json.dumps(patch),
-                ]
+                ["patch", "agenticsession", session, "-n", project, "--type=merge", "-p", self.PATCH_START]
             )
 
             if result.returncode != 0:
@@ -760,7 +1317,16 @@ class ACPClient:
         Returns:
             Dict with deletion results
         """
-        return await self._bulk_operation(project, sessions, self.delete_session, "deleted", dry_run)
+        if dry_run:
+            return await self._bulk_preview(
+                project,
+                sessions,
+                self.delete_session,
+                "deleted",
+                preview_fn=lambda session, data: self._dry_run_preview(project, session, "delete", data),
+            )
+
+        return await self._bulk_session_command(project, sessions, "delete", [], "deleted")
 
     async def bulk_stop_sessions(self, project: str, sessions: list[str], dry_run: bool = False) -> dict[str, Any]:
         """Stop multiple running sessions.
@@ -774,49 +1340,40 @@ class ACPClient:
             Dict with stop results
         """
 
-        async def stop_session(project: str, session: str, dry_run: bool = False) -> dict[str, Any]:
-            """Internal stop session helper."""
-            try:
-                session_data = await self._get_resource_json("agenticsession", session, project)
-                current_status = session_data.get("status", {}).get("phase")
+        if not dry_run:
+            return await self._bulk_session_command(
+                project, sessions, "patch", ["--type=merge", "-p", self.PATCH_STOP], "stopped"
+            )
 
-                if dry_run:
-                    return {
-                        "dry_run": True,
-                        "success": current_status == "running",
-                        "message": f"Session status: {current_status}",
-                        "session_info": {
-                            "name": session,
-                            "status": current_status,
-                        },
-                    }
+        def stop_preview(session: str, session_data: dict[str, Any] | None) -> dict[str, Any]:
+            """Internal stop session dry-run response."""
+            if session_data is None:
+                return {
+                    "stopped": False,
+                    "success": False,
+                    "message": f"Session '{session}' not found in project '{project}'",
+                }
 
-                # Stop the session
-                patch = {"spec": {"stopped": True}}
-                result = await self._run_oc_command(
-                    [
-                        "patch",
-                        "agenticsession",
-                        session,
-                        "-n",
-                        project,
-                        "--type=merge",
-                        "-p",
-                        json.dumps(patch),
-                    ]
-                )
+            current_status = session_data.get("status", {}).get("phase")
+            return {
+                "dry_run": True,
+                "success": current_status == "running",
+                "message": f"Session status: {current_status}",
+                "session_info": {
+                    "name": session,
+                    "status": current_status,
+                },
+            }
 
-                if result.returncode == 0:
-                    return {"stopped": True, "message": "Success"}
-                else:
-                    return {
-                        "stopped": False,
-                        "message": result.stderr.decode(),
-                    }
+        async def stop_session(project: str, session: str, dry_run: bool = False) -> dict[str, Any]:
+            """Internal stop session dry-run helper."""
+            try:
+                session_data = await self._get_resource_json("agenticsession", session, project)
             except Exception as e:
                 return {"stopped": False, "success": False, "message": str(e)}
+            return stop_preview(session, session_data)
 
-        return await self._bulk_operation(project, sessions, stop_session, "stopped", dry_run)
+        return await self._bulk_preview(project, sessions, stop_session, "stopped", preview_fn=stop_preview)
 
     async def bulk_restart_sessions(self, project: str, sessions: list[str], dry_run: bool = False) -> dict[str, Any]:
         """Restart multiple stopped sessions (max 3).
@@ -832,21 +1389,13 @@ class ACPClient:
         # Enforce limit
         self._validate_bulk_operation(sessions, "restart")
 
-        success = []
-        failed = []
-
-        for session in sessions:
-            result = await self.restart_session(project, session, dry_run)
-            if result.get("status") == "restarting" or result.get("success"):
-                success.append(session)
-            else:
-                failed.append({"session": session, "error": result.get("message")})
+        if not dry_run:
+            # Restart is a single patch, so all sessions go through one oc call
+            return await self._bulk_session_command(
+                project, sessions, "patch", ["--type=merge", "-p", self.PATCH_START], "restarted"
+            )
 
-        return {
-            "restarted": success,
-            "failed": failed,
-            "dry_run": dry_run,
-        }
+        return await self._bulk_preview(project, sessions, self.restart_session, "restarted")
 
     async def bulk_delete_sessions_by_label(
         self,
@@ -1019,70 +1568,99 @@ class ACPClient:
             self._validate_input(session, "session")
             if container:
                 # Container names have slightly different naming rules
-                if not re.match(r"^[a-z0-9]([-a-z0-9]*[a-z0-9])?$", container):
+                if not _DNS1123_RE.match(container):
                     raise ValueError(f"Invalid container name: {container}")
             # Security: Limit tail_lines to prevent DoS
             if tail_lines and (tail_lines < 1 or tail_lines > self.MAX_LOG_LINES):
                 raise ValueError(f"tail_lines must be between 1 and {self.MAX_LOG_LINES}")
 
-            # Find the pod for this session
-            pods = await self._list_resources_json("pods", project, selector=f"agenticsession={session}")
-
-            if not pods:
-                return {"logs": "", "error": f"No pods found for session '{session}'"}
-
-            pod_name = pods[0].get("metadata", {}).get("name")
-
-            # Build logs command
-            logs_args = ["logs", pod_name, "-n", project]
+            logs_flags = ["-n", project]
             if container:
-                logs_args.extend(["-c", container])
+                logs_flags.extend(["-c", container])
             if tail_lines:
-                logs_args.extend(["--tail", str(tail_lines)])
+                logs_flags.extend(["--tail", str(tail_lines)])
             else:
                 # Default limit to prevent memory exhaustion
-                logs_args.extend(["--tail", str(1000)])
+                logs_flags.extend(["--tail", str(1000)])
+            # Bound the payload at the source, whatever the line lengths
+            logs_flags.extend(["--limit-bytes", str(self.MAX_LOG_BYTES)])
 
-            result = await self._run_oc_command(logs_args)
+            # Let oc resolve the session's pod from its label: one round-trip instead of two.
+            # --tail/--limit-bytes apply per pod, so fetch one stream at a time without pod prefixes
+            # (the combined size is capped below in case several pods match).
+            result = await self._run_oc_command(
+                [
+                    "logs",
+                    "-l",
+                    f"agenticsession={session}",
+                    "--max-log-requests=1",
+                    "--prefix=false",
+                    *logs_flags,
+                ]
+            )
 
             if result.returncode != 0:
-                return {
-                    "logs": "",
-                    "error": f"Failed to retrieve logs: {result.stderr.decode()}",
-                }
+                # Fall back to finding the pod first (the pod list is served from the read cache on repeats)
+                pods = await self._list_resources_json("pods", project, selector=f"agenticsession={session}")
 
-            return {
-                "logs": result.stdout.decode(),
+                if not pods:
+                    return {"logs": "", "error": f"No pods found for session '{session}'"}
+
+                pod_name = pods[0].get("metadata", {}).get("name")
+                result = await self._run_oc_command(["logs", pod_name, *logs_flags])
+
+                if result.returncode != 0:
+                    return {
+                        "logs": "",
+                        "error": f"Failed to retrieve logs: {result.stderr.decode()}",
+                    }
+            elif not result.stdout and b"No resources found" in result.stderr:
+                return {"logs": "", "error": f"No pods found for session '{session}'"}
+
+            # The byte limit can cut a multi-byte character in half
+            logs = result.stdout[: self.MAX_LOG_BYTES].decode(errors="replace")
+            return {
+                "logs": logs,
                 "container": container or "default",
-                "lines": len(result.stdout.decode().split("\n")),
+                # Same as len(logs.split("\n")) without building the list
+                "lines": logs.count("\n") + 1,
             }
         except ValueError as e:
             return {"logs": "", "error": str(e)}
         except Exception as e:
             return {"logs": "", "error": f"Unexpected error: {str(e)}"}
 
-    def list_clusters(self) -> dict[str, Any]:
+    def list_clusters(self) -> Mapping[str, Any]:
         """List configured clusters.
 
+        The listing is built once per config change and shared between callers,
+        so it is returned as a read-only view.
+
         Returns:
-            Dict with clusters list
+            Read-only mapping with clusters list
         """
+        if self._clusters_listing is not None:
+            return self._clusters_listing
+
         clusters = []
         config = self.config
         default_cluster = config.get("default_cluster")
 
         for name, cluster_config in config.get("clusters", {}).items():
             clusters.append(
-                {
-                    "name": name,
-                    "server": cluster_config.get("server"),
-                    "description": cluster_config.get("description", ""),
-                    "default_project": cluster_config.get("default_project"),
-                    "is_default": name == default_cluster,
-                }
+                MappingProxyType(
+                    {
+                        "name": name,
+                        "server": cluster_config.get("server"),
+                        "description": cluster_config.get("description", ""),
+                        "default_project": cluster_config.get("default_project"),
+                        "is_default": name == default_cluster,
+                    }
+                )
             )
 
-        return {"clusters": clusters, "default_cluster": default_cluster}
+        self._clusters_listing = MappingProxyType({"clusters": tuple(clusters), "default_cluster": default_cluster})
+        return self._clusters_listing
 
     async def whoami(self) -> dict[str, Any]:
         """Get current user and cluster information.
@@ -1090,50 +1668,35 @@ class ACPClient:
         Returns:
             Dict with user info
         """
-        # Get current user
-        user_result = await self._run_oc_command(["whoami"])
-        user = user_result.stdout.decode().strip() if user_result.returncode == 0 else "unknown"
-
-        # Get current server
-        server_result = await self._run_oc_command(["whoami", "--show-server"])
-        server = server_result.stdout.decode().strip() if server_result.returncode == 0 else "unknown"
+        # The four queries are independent, so run them concurrently
+        user_result, server_result, project_result, token_result = await asyncio.gather(
+            self._run_oc_command(["whoami"]),
+            self._run_oc_command(["whoami", "--show-server"]),
+            self._run_oc_command(["project", "-q"]),
+            self._run_oc_command(["whoami", "-t"]),
+            return_exceptions=True,
+        )
 
-        # Get current project
-        project_result = await self._run_oc_command(["project", "-q"])
-        project = project_result.stdout.decode().strip() if project_result.returncode == 0 else "unknown"
+        def output_or_unknown(result: subprocess.CompletedProcess | BaseException) -> str:
+            if isinstance(result, BaseException) or result.returncode != 0:
+                return "unknown"
+            return result.stdout.decode().strip()
 
-        # Get token info
-        token_result = await self._run_oc_command(["whoami", "-t"])
-        token_valid = token_result.returncode == 0
+        user = output_or_unknown(user_result)
+        server = output_or_unknown(server_result)
+        project = output_or_unknown(project_result)
+        token_valid = not isinstance(token_result, BaseException) and token_result.returncode == 0
 
-        # Try to get token expiry (if available)
+        # Note: OpenShift doesn't expose token expiry via the CLI
         token_expires = None
-        if token_valid:
-            # Get token and decode to check expiry
-            # Note: token variable intentionally unused - for future enhancement
-            try:
-                # Try to get token info from oc
-                token_info_result = await self._run_oc_command(["whoami", "--show-token"])
-                if token_info_result.returncode == 0:
-                    # Note: OpenShift doesn't provide expiry via CLI easily
-                    # This is a placeholder for future enhancement
-                    token_expires = None
-            except Exception:
-                pass
 
         # Get current cluster name (if available from config)
-        cluster = "unknown"
-        cluster_config_data = None
-        for name, cluster_config in self.config.get("clusters", {}).items():
-            if cluster_config.get("server") == server:
-                cluster = name
-                cluster_config_data = cluster_config
-                break
+        cluster, default_project = self._server_to_cluster.get(server, ("unknown", None))
 
         # Prefer default_project from config over current oc project
         # This ensures we use the configured project even if oc is set to a different one
-        if cluster_config_data and cluster_config_data.get("default_project"):
-            project = cluster_config_data.get("default_project")
+        if default_project:
+            project = default_project
 
         return {
             "user": user,
@@ -1146,6 +1709,7 @@ class ACPClient:
         }
 
     # P2 Feature: Clone Session
+    @_return_on_error("message", cloned=False)
     async def clone_session(
         self, project: str, source_session: str, new_display_name: str, dry_run: bool = False
     ) -> dict[str, Any]:
@@ -1160,77 +1724,95 @@ class ACPClient:
         Returns:
             Dict with cloned session info
         """
-        try:
-            # Get source session
-            source_data = await self._get_resource_json("agenticsession", source_session, project)
-
-            if dry_run:
-                return {
-                    "dry_run": True,
-                    "success": True,
-                    "message": f"Would clone session '{source_session}' with display name '{new_display_name}'",
-                    "source_info": {
-                        "name": source_data.get("metadata", {}).get("name"),
-                        "display_name": source_data.get("spec", {}).get("displayName"),
-                        "repos": source_data.get("spec", {}).get("repos", []),
-                        "workflow": source_data.get("spec", {}).get("workflow"),
-                    },
-                }
+        # Get source session
+        source_data = await self._get_resource_json("agenticsession", source_session, project)
 
-            # Create new session from source spec
-            new_spec = source_data.get("spec", {}).copy()
-            new_spec["displayName"] = new_display_name
-            new_spec["stopped"] = False  # Start new session as running
-
-            # Create session manifest
-            manifest = {
-                "apiVersion": "vteam.ambient-code/v1alpha1",
-                "kind": "AgenticSession",
-                "metadata": {
-                    "generateName": f"{source_session}-clone-",
-                    "namespace": project,
+        if dry_run:
+            return {
+                "dry_run": True,
+                "success": True,
+                "message": f"Would clone session '{source_session}' with display name '{new_display_name}'",
+                "source_info": {
+                    "name": source_data.get("metadata", {}).get("name"),
+                    "display_name": source_data.get("spec", {}).get("displayName"),
+                    "repos": source_data.get("spec", {}).get("repos", []),
+                    "workflow": source_data.get("spec", {}).get("workflow"),
                 },
-                "spec": new_spec,
             }
 
-            # Apply manifest using secure temporary file
-            import os
-            import tempfile
+        # Create new session from source spec
+        new_spec = source_data.get("spec", {}).copy()
+        new_spec["displayName"] = new_display_name
+        new_spec["stopped"] = False  # Start new session as running
+
+        # Create session manifest
+        manifest = {
+            "apiVersion": "vteam.ambient-code/v1alpha1",
+            "kind": "AgenticSession",
+            "metadata": {
+                "generateName": f"{source_session}-clone-",
+                "namespace": project,
+            },
+            "spec": new_spec,
+        }
 
-            # Security: Use secure temp file with proper permissions (0600)
-            fd, manifest_file = tempfile.mkstemp(suffix=".yaml", prefix=f"acp-clone-{secrets.token_hex(8)}-")
-            try:
-                # Write to file descriptor with secure permissions
-                with os.fdopen(fd, "w") as f:
-                    yaml.dump(manifest, f)
+        # Pipe the manifest to 'oc create -f -' as JSON (valid YAML): no temp file to write and clean up
+        result = await self._run_oc_command(
+            ["create", "-f", "-", "-n", project, "-o", "json"], input=json.dumps(manifest).encode()
+        )
 
-                result = await self._run_oc_command(["create", "-f", manifest_file, "-o", "json"])
+        if result.returncode != 0:
+            return {
+                "cloned": False,
+                "message": f"Failed to clone session: {result.stderr.decode()}",
+            }
 
-                if result.returncode != 0:
-                    return {
-                        "cloned": False,
-                        "message": f"Failed to clone session: {result.stderr.decode()}",
-                    }
+        created_data = json.loads(result.stdout)
+        new_session_name = created_data.get("metadata", {}).get("name")
 
-                created_data = json.loads(result.stdout.decode())
-                new_session_name = created_data.get("metadata", {}).get("name")
+        return {
+            "cloned": True,
+            "session": new_session_name,
+            "message": f"Successfully cloned session '{source_session}' to '{new_session_name}'",
+        }
 
-                return {
-                    "cloned": True,
-                    "session": new_session_name,
-                    "message": f"Successfully cloned session '{source_session}' to '{new_session_name}'",
-                }
-            finally:
-                # Ensure cleanup even if operation fails
-                try:
-                    os.unlink(manifest_file)
-                except OSError:
-                    pass
+    @staticmethod
+    def _format_transcript(transcript_data: list[dict[str, Any]], session: str, format: str) -> dict[str, Any]:
+        """Format a session transcript for get_session_transcript.
 
-        except Exception as e:
-            return {"cloned": False, "message": str(e)}
+        Args:
+            transcript_data: Transcript entries from the session status
+            session: Session name
+            format: Output format ("json" or "markdown")
+
+        Returns:
+            Dict with transcript data
+        """
+        if format == "markdown":
+            # Convert to markdown format (collect the pieces and join once: linear in size)
+            parts = [f"# Session Transcript: {session}\n\n"]
+            for idx, entry in enumerate(transcript_data, 1):
+                role = entry.get("role", "unknown")
+                content = entry.get("content", "")
+                timestamp = entry.get("timestamp", "")
+                stamp = f"*{timestamp}*\n\n" if timestamp else ""
+                parts.append(f"## Message {idx} - {role}\n{stamp}{content}\n\n---\n\n")
+
+            return {
+                "transcript": "".join(parts),
+                "format": "markdown",
+                "message_count": len(transcript_data),
+            }
+
+        # Return as JSON
+        return {
+            "transcript": transcript_data,
+            "format": "json",
+            "message_count": len(transcript_data),
+        }
 
     # P2 Feature: Get Session Transcript
+    @_return_on_error("error", transcript=None)
     async def get_session_transcript(self, project: str, session: str, format: str = "json") -> dict[str, Any]:
         """Get session transcript/conversation history.
 
@@ -1242,48 +1824,15 @@ class ACPClient:
         Returns:
             Dict with transcript data
         """
-        try:
-            session_data = await self._get_resource_json("agenticsession", session, project)
-
-            # Get events which contain the conversation
-            # Note: events variable intentionally unused - for future enhancement
-            # events = await self._list_resources_json(
-            #     "event", project, selector=f"involvedObject.name={session}"
-            # )
-
-            # Extract transcript from session status if available
-            transcript_data = session_data.get("status", {}).get("transcript") or []
-
-            if format == "markdown":
-                # Convert to markdown format
-                markdown = f"# Session Transcript: {session}\n\n"
-                for idx, entry in enumerate(transcript_data):
-                    role = entry.get("role", "unknown")
-                    content = entry.get("content", "")
-                    timestamp = entry.get("timestamp", "")
-                    markdown += f"## Message {idx + 1} - {role}\n"
-                    if timestamp:
-                        markdown += f"*{timestamp}*\n\n"
-                    markdown += f"{content}\n\n"
-                    markdown += "---\n\n"
-
-                return {
-                    "transcript": markdown,
-                    "format": "markdown",
-                    "message_count": len(transcript_data),
-                }
-            else:
-                # Return as JSON
-                return {
-                    "transcript": transcript_data,
-                    "format": "json",
-                    "message_count": len(transcript_data),
-                }
+        # The transcript lives in the session status; events aren't needed, so
+        # this is a single read.
+        session_data = await self._get_resource_json("agenticsession", session, project)
 
-        except Exception as e:
-            return {"transcript": None, "error": str(e)}
+        transcript_data = session_data.get("status", {}).get("transcript") or []
+        return self._format_transcript(transcript_data, session, format)
 
     # P2 Feature: Update Session
+    @_return_on_error("message", updated=False)
     async def update_session(
         self,
         project: str,
@@ -1304,70 +1853,60 @@ class ACPClient:
         Returns:
             Dict with update status
         """
-        try:
-            session_data = await self._get_resource_json("agenticsession", session, project)
-
-            if dry_run:
-                updates = {}
-                if display_name:
-                    updates["displayName"] = display_name
-                if timeout:
-                    updates["timeout"] = timeout
+        # Fields to change; shared by the dry-run preview and the patch
+        updates = {}
+        if display_name:
+            updates["displayName"] = display_name
+        if timeout:
+            updates["timeout"] = timeout
 
-                return {
-                    "dry_run": True,
-                    "success": True,
-                    "message": f"Would update session '{session}'",
-                    "updates": updates,
-                    "current": {
-                        "displayName": session_data.get("spec", {}).get("displayName"),
-                        "timeout": session_data.get("spec", {}).get("timeout"),
-                    },
-                }
+        if dry_run:
+            session_data = await self._get_resource_json("agenticsession", session, project)
+            return {
+                "dry_run": True,
+                "success": True,
+                "message": f"Would update session '{session}'",
+                "updates": updates,
+                "current": {
+                    "displayName": session_data.get("spec", {}).get("displayName"),
+                    "timeout": session_data.get("spec", {}).get("timeout"),
+                },
+            }
 
-            # Build patch
-            patch = {"spec": {}}
-            if display_name:
-                patch["spec"]["displayName"] = display_name
-            if timeout:
-                patch["spec"]["timeout"] = timeout
+        if not updates:
+            return {"updated": False, "message": "No updates specified"}
 
-            if not patch["spec"]:
-                return {"updated": False, "message": "No updates specified"}
+        # Security: Validate inputs (the patch goes straight out without a preliminary read)
+        self._validate_input(project, "project")
+        self._validate_input(session, "session")
 
+        patch = {"spec": updates}
+        patch_json = json.dumps(patch, separators=(",", ":"))
+        path = self.API_RESOURCE_PATHS["agenticsession"].format(namespace=project) + f"/{session}"
+        result = await self._api_merge_patch(path, patch_json)
+        if result is None:
             result = await self._run_oc_command(
-                [
-                    "patch",
-                    "agenticsession",
-                    session,
-                    "-n",
-                    project,
-                    "--type=merge",
-                    "-p",
-                    json.dumps(patch),
-                    "-o",
-                    "json",
-                ]
+                ["patch", "agenticsession", session, "-n", project, "--type=merge", "-p", patch_json, "-o", "json"]
             )
+        else:
+            self._invalidate_cache(project)
 
-            if result.returncode != 0:
-                return {
-                    "updated": False,
-                    "message": f"Failed to update session: {result.stderr.decode()}",
-                }
-
-            updated_data = json.loads(result.stdout.decode())
-
+        if result.returncode != 0:
             return {
-                "updated": True,
-                "session": updated_data,
-                "message": f"Successfully updated session '{session}'",
+                "updated": False,
+                "message": f"Failed to update session: {result.stderr.decode()}",
             }
 
-        except Exception as e:
-            return {"updated": False, "message": str(e)}
+        updated_data = json.loads(result.stdout)
+
+        return {
+            "updated": True,
+            "session": updated_data,
+            "message": f"Successfully updated session '{session}'",
+        }
 
     # P2 Feature: Export Session
+    @_return_on_error("error", exported=False)
     async def export_session(self, project: str, session: str) -> dict[str, Any]:
         """Export session configuration and transcript.
 
@@ -1378,39 +1917,36 @@ class ACPClient:
         Returns:
             Dict with exported session data
         """
-        try:
-            session_data = await self._get_resource_json("agenticsession", session, project)
-
-            # Get transcript
-            transcript_result = await self.get_session_transcript(project, session, format="json")
-
-            export_data = {
-                "config": {
-                    "name": session_data.get("metadata", {}).get("name"),
-                    "displayName": session_data.get("spec", {}).get("displayName"),
-                    "repos": session_data.get("spec", {}).get("repos", []),
-                    "workflow": session_data.get("spec", {}).get("workflow"),
-                    "llmConfig": session_data.get("spec", {}).get("llmConfig", {}),
-                },
-                "transcript": transcript_result.get("transcript", []),
-                "metadata": {
-                    "created": session_data.get("metadata", {}).get("creationTimestamp"),
-                    "status": session_data.get("status", {}).get("phase"),
-                    "stoppedAt": session_data.get("status", {}).get("stoppedAt"),
-                    "messageCount": transcript_result.get("message_count", 0),
-                },
-            }
-
-            return {
-                "exported": True,
-                "data": export_data,
-                "message": f"Successfully exported session '{session}'",
-            }
+        session_data = await self._get_resource_json("agenticsession", session, project)
+
+        # Transcript comes from the same session object - no second read
+        transcript = session_data.get("status", {}).get("transcript") or []
+
+        export_data = {
+            "config": {
+                "name": session_data.get("metadata", {}).get("name"),
+                "displayName": session_data.get("spec", {}).get("displayName"),
+                "repos": session_data.get("spec", {}).get("repos", []),
+                "workflow": session_data.get("spec", {}).get("workflow"),
+                "llmConfig": session_data.get("spec", {}).get("llmConfig", {}),
+            },
+            "transcript": transcript,
+            "metadata": {
+                "created": session_data.get("metadata", {}).get("creationTimestamp"),
+                "status": session_data.get("status", {}).get("phase"),
+                "stoppedAt": session_data.get("status", {}).get("stoppedAt"),
+                "messageCount": len(transcript),
+            },
+        }
 
-        except Exception as e:
-            return {"exported": False, "error": str(e)}
+        return {
+            "exported": True,
+            "data": export_data,
+            "message": f"Successfully exported session '{session}'",
+        }
 
     # P3 Feature: Get Session Metrics
+    @_return_on_error("error")
     async def get_session_metrics(self, project: str, session: str) -> dict[str, Any]:
         """Get session metrics and statistics.
 
@@ -1421,54 +1957,232 @@ class ACPClient:
         Returns:
             Dict with session metrics
         """
-        try:
-            session_data = await self._get_resource_json("agenticsession", session, project)
+        session_data = await self._get_resource_json("agenticsession", session, project)
 
-            # Get transcript for analysis
-            transcript_result = await self.get_session_transcript(project, session, format="json")
-            transcript = transcript_result.get("transcript") or []
+        # Transcript comes from the same session object - no second read
+        transcript = session_data.get("status", {}).get("transcript") or []
 
-            # Calculate metrics
-            token_count = 0
-            message_count = len(transcript) if transcript else 0
-            tool_calls = {}
+        # Calculate metrics
+        word_count = 0
+        message_count = len(transcript) if transcript else 0
+        tool_calls: Counter[str] = Counter()
 
-            for entry in transcript:
-                # Count tokens (approximate)
-                content = entry.get("content", "")
-                token_count += len(content.split()) * 1.3  # Rough estimate
+        for entry in transcript:
+            # Count words; scaled to an approximate token count once below
+            word_count += len(entry.get("content", "").split())
 
-                # Count tool calls
-                if "tool_calls" in entry:
-                    for tool_call in entry.get("tool_calls", []):
-                        tool_name = tool_call.get("name", "unknown")
-                        tool_calls[tool_name] = tool_calls.get(tool_name, 0) + 1
+            # Count tool calls
+            tool_calls.update(tool_call.get("name", "unknown") for tool_call in entry.get("tool_calls", ()))
 
-            # Calculate duration
-            created = session_data.get("metadata", {}).get("creationTimestamp")
-            stopped = session_data.get("status", {}).get("stoppedAt")
+        # Calculate duration
+        created = session_data.get("metadata", {}).get("creationTimestamp")
+        stopped = session_data.get("status", {}).get("stoppedAt")
 
-            duration_seconds = 0
-            if created and stopped:
-                try:
-                    from datetime import datetime
+        duration_seconds = 0
+        if created and stopped:
+            try:
+                # fromisoformat accepts the trailing 'Z' since Python 3.11
+                created_dt = datetime.fromisoformat(created)
+                stopped_dt = datetime.fromisoformat(stopped)
+                duration_seconds = int((stopped_dt - created_dt).total_seconds())
+            except (TypeError, ValueError):
+                pass
 
-                    created_dt = datetime.fromisoformat(created.replace("Z", "+00:00"))
-                    stopped_dt = datetime.fromisoformat(stopped.replace("Z", "+00:00"))
-                    duration_seconds = int((stopped_dt - created_dt).total_seconds())
-                except Exception:
-                    pass
+        return {
+            "token_count": int(word_count * 1.3),  # Rough estimate
+            "duration_seconds": duration_seconds,
+            "tool_calls": dict(tool_calls),
+            "message_count": message_count,
+            "status": session_data.get("status", {}).get("phase"),
+        }
 
-            return {
-                "token_count": int(token_count),
-                "duration_seconds": duration_seconds,
-                "tool_calls": tool_calls,
-                "message_count": message_count,
-                "status": session_data.get("status", {}).get("phase"),
-            }
+    @staticmethod
+    def _iter_workflow_files(root: str) -> Iterator[os.DirEntry]:
+        """Walk a directory tree for *.yaml files without following directory symlinks.
 
-        except Exception as e:
-            return {"error": str(e)}
+        Args:
+            root: Directory to walk
+
+        Yields:
+            Directory entries of the YAML files found
+        """
+        pending = [root]
+        while pending:
+            try:
+                with os.scandir(pending.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                        elif entry.name.endswith(".yaml"):
+                            yield entry
+            except OSError:
+                continue
+
+    @staticmethod
+    def _read_workflow_description(workflow_file: Path) -> str:
+        """Read the top-level description of a workflow file.
+
+        The whole document is parsed (with libyaml when available), so duplicate keys,
+        continued scalars and malformed files behave exactly as in YAML.
+
+        Args:
+            workflow_file: Path to the workflow YAML file
+
+        Returns:
+            Description string, or "" if missing or not a string
+
+        Raises:
+            OSError: If the file cannot be read
+            yaml.YAMLError: If the file is not valid YAML
+        """
+        workflow_data = yaml.load(workflow_file.read_bytes(), Loader=_YamlLoader)
+
+        if not isinstance(workflow_data, dict):
+            return ""
+        description = workflow_data.get("description", "")
+        return description if isinstance(description, str) else ""
+
+    async def _run_git(self, *args: str) -> tuple[int, bytes, bytes]:
+        """Run a git command.
+
+        Args:
+            *args: git arguments
+
+        Returns:
+            Tuple of (returncode, stdout, stderr)
+
+        Raises:
+            TimeoutError: If the command takes longer than 60 seconds
+        """
+        process = await asyncio.create_subprocess_exec(
+            "git",
+            *args,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        stdout, stderr = await asyncio.wait_for(
+            process.communicate(),
+            timeout=60,  # 60 second timeout for each git step
+        )
+        return process.returncode, stdout, stderr
+
+    async def _sync_workflow_checkout(self, repo_url: str) -> str:
+        """Return an up-to-date checkout of a workflow repository's workflows/ directory.
+
+        The first call clones into a temporary directory; later calls reuse it, checking the
+        remote HEAD at most once per cache_ttl_seconds and fetching only when it has moved.
+        At most MAX_WORKFLOW_CHECKOUTS checkouts are kept; the least recently used ones are
+        deleted. Callers must hold self._workflow_lock.
+
+        Args:
+            repo_url: Validated repository URL
+
+        Returns:
+            Path of the checkout
+
+        Raises:
+            RuntimeError: If the repository cannot be cloned
+            TimeoutError: If a git command times out
+        """
+        entry = self._workflow_checkouts.pop(repo_url, None)
+        if entry and os.path.isdir(entry[0]):
+            checkout, checked_at = entry
+            # Re-inserted on every use, so dict order tracks recency
+            self._workflow_checkouts[repo_url] = entry
+            if time.monotonic() - checked_at < self.settings.cache_ttl_seconds:
+                return checkout
+
+            returncode, remote_head, _ = await self._run_git("ls-remote", "--", repo_url, "HEAD")
+            if returncode != 0:
+                # Remote unreachable: the previous checkout is the best answer available
+                logger.warning("workflow_repo_check_failed", repo_url=repo_url)
+                return checkout
+
+            _, local_head, _ = await self._run_git("-C", checkout, "rev-parse", "HEAD")
+            if remote_head.split()[:1] == local_head.split():
+                self._workflow_checkouts[repo_url] = (checkout, time.monotonic())
+                return checkout
+
+            returncode, _, stderr = await self._run_git("-C", checkout, "fetch", "--depth", "1", "origin")
+            if returncode == 0:
+                returncode, _, stderr = await self._run_git("-C", checkout, "reset", "--hard", "FETCH_HEAD")
+            if returncode == 0:
+                self._workflow_checkouts[repo_url] = (checkout, time.monotonic())
+                return checkout
+
+            logger.warning("workflow_repo_update_failed", repo_url=repo_url, error=stderr.decode(errors="replace"))
+            del self._workflow_checkouts[repo_url]
+            shutil.rmtree(checkout, ignore_errors=True)
+
+        # Security: Use secure temp directory with random name
+        checkout = tempfile.mkdtemp(prefix="acp-workflows-")
+        try:
+            # Partial + sparse clone: only the blobs under workflows/ are downloaded
+            for git_args in (
+                ["clone", "--depth", "1", "--filter=blob:none", "--sparse", "--", repo_url, checkout],
+                ["-C", checkout, "sparse-checkout", "set", "workflows"],
+            ):
+                returncode, _, stderr = await self._run_git(*git_args)
+                if returncode != 0:
+                    raise RuntimeError(f"Failed to clone repository: {stderr.decode()}")
+        except BaseException:
+            shutil.rmtree(checkout, ignore_errors=True)
+            raise
+
+        if not self._workflow_cleanup_registered:
+            atexit.register(self._remove_workflow_checkouts)
+            self._workflow_cleanup_registered = True
+        self._workflow_checkouts[repo_url] = (checkout, time.monotonic())
+        while len(self._workflow_checkouts) > self.MAX_WORKFLOW_CHECKOUTS:
+            evicted = next(iter(self._workflow_checkouts))
+            shutil.rmtree(self._workflow_checkouts.pop(evicted)[0], ignore_errors=True)
+        return checkout
+
+    def _remove_workflow_checkouts(self) -> None:
+        """Delete all workflow repository checkouts (registered to run at exit)."""
+        for checkout, _ in self._workflow_checkouts.values():
+            shutil.rmtree(checkout, ignore_errors=True)
+        self._workflow_checkouts.clear()
+
+    @classmethod
+    def _scan_workflows(cls, workflows_dir: str) -> list[dict[str, str]]:
+        """Collect name, path and description of the workflow files in a directory.
+
+        Args:
+            workflows_dir: Resolved path of the checkout's workflows/ directory
+
+        Returns:
+            List of workflow dicts (at most 100 files are examined)
+        """
+        workflows = []
+        if os.path.isdir(workflows_dir):
+            # Limit to prevent DoS
+            file_count = 0
+            max_files = 100
+            for entry in cls._iter_workflow_files(workflows_dir):
+                if file_count >= max_files:
+                    break
+                file_count += 1
+
+                # Security: Validate file is within expected directory. Directory
+                # symlinks are never followed, so only a symlinked file can escape.
+                if entry.is_symlink() and not os.path.realpath(entry.path).startswith(workflows_dir + os.sep):
+                    continue  # Skip files outside workflows directory
+
+                # Read workflow to get metadata
+                try:
+                    workflows.append(
+                        {
+                            "name": os.path.splitext(entry.name)[0],
+                            "path": os.path.relpath(entry.path, workflows_dir),
+                            "description": cls._read_workflow_description(Path(entry.path)),
+                        }
+                    )
+                except (yaml.YAMLError, OSError):
+                    # Skip invalid workflow files
+                    continue
+
+        return workflows
 
     # P3 Feature: List Workflows
     async def list_workflows(self, repo_url: str | None = None) -> dict[str, Any]:
@@ -1489,101 +2203,34 @@ class ACPClient:
         if not (repo_url.startswith("https://") or repo_url.startswith("http://")):
             return {"workflows": [], "error": "Repository URL must use http:// or https://"}
         # Prevent command injection through URL
-        if any(char in repo_url for char in [";", "|", "&", "$", "`", "\n", "\r", " "]):
+        if _REPO_URL_BAD_CHARS_RE.search(repo_url):
             return {"workflows": [], "error": "Invalid characters in repository URL"}
 
         try:
-            # Clone repo to temp directory
-            import shutil
-            import tempfile
-
-            # Security: Use secure temp directory with random name
-            temp_dir = tempfile.mkdtemp(prefix=f"acp-workflows-{secrets.token_hex(8)}-")
+            # One sync/scan at a time, so concurrent calls never race on a checkout (or its eviction)
+            async with self._workflow_lock:
+                checkout = await self._sync_workflow_checkout(repo_url)
 
-            try:
-                # Clone the repo using secure subprocess
-                process = await asyncio.create_subprocess_exec(
-                    "git",
-                    "clone",
-                    "--depth",
-                    "1",
-                    "--",
-                    repo_url,
-                    temp_dir,
-                    stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE,
-                )
-                stdout, stderr = await asyncio.wait_for(
-                    process.communicate(),
-                    timeout=60,  # 60 second timeout for git clone
+                # Reading and parsing the files is blocking work: keep it off the event loop
+                workflows = await asyncio.to_thread(
+                    self._scan_workflows, os.path.realpath(os.path.join(checkout, "workflows"))
                 )
 
-                if process.returncode != 0:
-                    return {
-                        "workflows": [],
-                        "error": f"Failed to clone repository: {stderr.decode()}",
-                    }
-
-                # Find workflow files
-                workflows = []
-                workflows_dir = Path(temp_dir) / "workflows"
-
-                if workflows_dir.exists():
-                    # Limit to prevent DoS
-                    file_count = 0
-                    max_files = 100
-                    for workflow_file in workflows_dir.glob("**/*.yaml"):
-                        if file_count >= max_files:
-                            break
-                        file_count += 1
-
-                        # Security: Validate file is within expected directory
-                        try:
-                            workflow_file.resolve().relative_to(workflows_dir.resolve())
-                        except ValueError:
-                            continue  # Skip files outside workflows directory
-
-                        # Read workflow to get metadata
-                        try:
-                            with open(workflow_file) as f:
-                                workflow_data = yaml.safe_load(f)
-                                if not isinstance(workflow_data, dict):
-                                    workflow_data = {}
-
-                            workflows.append(
-                                {
-                                    "name": workflow_file.stem,
-                                    "path": str(workflow_file.relative_to(workflows_dir)),
-                                    "description": (
-                                        workflow_data.get("description", "")
-                                        if isinstance(workflow_data.get("description"), str)
-                                        else ""
-                                    ),
-                                }
-                            )
-                        except (yaml.YAMLError, OSError):
-                            # Skip invalid workflow files
-                            continue
-
                 return {
                     "workflows": workflows,
                     "repo_url": repo_url,
                     "count": len(workflows),
                 }
 
-            finally:
-                # Clean up temp directory securely
-                try:
-                    shutil.rmtree(temp_dir, ignore_errors=True)
-                except Exception:
-                    pass
-
         except TimeoutError:
             return {"workflows": [], "error": "Repository clone timed out"}
+        except RuntimeError as e:
+            return {"workflows": [], "error": str(e)}
         except Exception as e:
             return {"workflows": [], "error": f"Unexpected error: {str(e)}"}
 
     # P3 Feature: Create Session from Template
+    @_return_on_error("message", created=False)
     async def create_session_from_template(
         self,
         project: str,
@@ -1646,61 +2293,47 @@ class ACPClient:
                 "repos": repos or [],
             }
 
-        try:
-            # Create session manifest
-            manifest = {
-                "apiVersion": "vteam.ambient-code/v1alpha1",
-                "kind": "AgenticSession",
-                "metadata": {
-                    "generateName": f"{template}-",
-                    "namespace": project,
-                },
-                "spec": {
-                    "displayName": display_name,
-                    "workflow": template_config["workflow"],
-                    "llmConfig": template_config["llmConfig"],
-                    "repos": repos or [],
-                },
-            }
-
-            # Apply manifest using secure temporary file
-            import os
-            import tempfile
-
-            # Security: Use secure temp file with proper permissions (0600)
-            fd, manifest_file = tempfile.mkstemp(suffix=".yaml", prefix=f"acp-template-{secrets.token_hex(8)}-")
-            try:
-                # Write to file descriptor with secure permissions
-                with os.fdopen(fd, "w") as f:
-                    yaml.dump(manifest, f)
+        # Security: Validate inputs (project is passed to oc as -n)
+        self._validate_input(project, "project")
 
-                result = await self._run_oc_command(["create", "-f", manifest_file, "-o", "json"])
+        # Create session manifest
+        manifest = {
+            "apiVersion": "vteam.ambient-code/v1alpha1",
+            "kind": "AgenticSession",
+            "metadata": {
+                "generateName": f"{template}-",
+                "namespace": project,
+            },
+            "spec": {
+                "displayName": display_name,
+                "workflow": template_config["workflow"],
+                "llmConfig": template_config["llmConfig"],
+                "repos": repos or [],
+            },
+        }
 
-                if result.returncode != 0:
-                    return {
-                        "created": False,
-                        "message": f"Failed to create session: {result.stderr.decode()}",
-                    }
+        # Pipe the manifest to 'oc create -f -' as JSON (valid YAML): no temp file to write and clean up
+        result = await self._run_oc_command(
+            ["create", "-f", "-", "-n", project, "-o", "json"], input=json.dumps(manifest).encode()
+        )
 
-                created_data = json.loads(result.stdout.decode())
-                session_name = created_data.get("metadata", {}).get("name")
+        if result.returncode != 0:
+            return {
+                "created": False,
+                "message": f"Failed to create session: {result.stderr.decode()}",
+            }
 
-                return {
-                    "created": True,
-                    "session": session_name,
-                    "message": f"Successfully created session '{session_name}' from template '{template}'",
-                }
-            finally:
-                # Ensure cleanup even if operation fails
-                try:
-                    os.unlink(manifest_file)
-                except OSError:
-                    pass
+        created_data = json.loads(result.stdout)
+        session_name = created_data.get("metadata", {}).get("name")
 
-        except Exception as e:
-            return {"created": False, "message": str(e)}
+        return {
+            "created": True,
+            "session": session_name,
+            "message": f"Successfully created session '{session_name}' from template '{template}'",
+        }
 
     # Auth Feature: Login
+    @_return_on_error("message", authenticated=False)
     async def login(self, cluster: str, web: bool = True, token: str | None = None) -> dict[str, Any]:
         """Authenticate to OpenShift cluster.
 
@@ -1717,46 +2350,43 @@ class ACPClient:
         if cluster in self.config.get("clusters", {}):
             server = self.config["clusters"][cluster]["server"]
 
-        try:
-            if token:
-                # Token-based login
-                result = await self._run_oc_command(
-                    ["login", "--token", token, "--server", server],
-                    capture_output=False,
-                )
-            elif web:
-                # Web-based login
-                result = await self._run_oc_command(
-                    ["login", "--web", "--server", server],
-                    capture_output=False,
-                )
-            else:
-                return {
-                    "authenticated": False,
-                    "message": "Either 'web' or 'token' must be provided",
-                }
-
-            if result.returncode != 0:
-                return {
-                    "authenticated": False,
-                    "message": "Login failed",
-                }
-
-            # Get user info after login
-            whoami_result = await self.whoami()
+        if token:
+            # Token-based login
+            result = await self._run_oc_command(
+                ["login", "--token", token, "--server", server],
+                capture_output=False,
+            )
+        elif web:
+            # Web-based login
+            result = await self._run_oc_command(
+                ["login", "--web", "--server", server],
+                capture_output=False,
+            )
+        else:
+            return {
+                "authenticated": False,
+                "message": "Either 'web' or 'token' must be provided",
+            }
 
+        if result.returncode != 0:
             return {
-                "authenticated": True,
-                "user": whoami_result.get("user"),
-                "cluster": cluster,
-                "server": server,
-                "message": f"Successfully logged in to {cluster}",
+                "authenticated": False,
+                "message": "Login failed",
             }
 
-        except Exception as e:
-            return {"authenticated": False, "message": str(e)}
+        # Get user info after login
+        whoami_result = await self.whoami()
+
+        return {
+            "authenticated": True,
+            "user": whoami_result.get("user"),
+            "cluster": cluster,
+            "server": server,
+            "message": f"Successfully logged in to {cluster}",
+        }
 
     # Auth Feature: Switch Cluster
+    @_return_on_error("message", switched=False)
     async def switch_cluster(self, cluster: str) -> dict[str, Any]:
         """Switch to a different cluster context.
 
@@ -1775,36 +2405,32 @@ class ACPClient:
         cluster_config = self.config["clusters"][cluster]
         server = cluster_config["server"]
 
-        try:
-            # Get current context
-            current_whoami = await self.whoami()
-            previous_cluster = current_whoami.get("cluster", "unknown")
-
-            # Switch context (assumes already authenticated)
-            result = await self._run_oc_command(
-                ["login", "--server", server],
-                capture_output=False,
-            )
+        # Get current context
+        current_whoami = await self.whoami()
+        previous_cluster = current_whoami.get("cluster", "unknown")
 
-            if result.returncode != 0:
-                return {
-                    "switched": False,
-                    "message": f"Failed to switch to {cluster}. You may need to login first.",
-                }
-
-            # Get new user info
-            new_whoami = await self.whoami()
+        # Switch context (assumes already authenticated)
+        result = await self._run_oc_command(
+            ["login", "--server", server],
+            capture_output=False,
+        )
 
+        if result.returncode != 0:
             return {
-                "switched": True,
-                "previous": previous_cluster,
-                "current": cluster,
-                "user": new_whoami.get("user"),
-                "message": f"Switched from {previous_cluster} to {cluster}",
+                "switched": False,
+                "message": f"Failed to switch to {cluster}. You may need to login first.",
             }
 
-        except Exception as e:
-            return {"switched": False, "message": str(e)}
+        # Get new user info
+        new_whoami = await self.whoami()
+
+        return {
+            "switched": True,
+            "previous": previous_cluster,
+            "current": cluster,
+            "user": new_whoami.get("user"),
+            "message": f"Switched from {previous_cluster} to {cluster}",
+        }
 
     # Auth Feature: Add Cluster
     def add_cluster(
@@ -1829,7 +2455,7 @@ class ACPClient:
         """
         try:
             # Security: Validate inputs
-            if not isinstance(name, str) or not re.match(r"^[a-z0-9]([-a-z0-9]*[a-z0-9])?$", name):
+            if not isinstance(name, str) or not _DNS1123_RE.match(name):
                 return {"added": False, "message": "Invalid cluster name format"}
             if not isinstance(server, str) or not (server.startswith("https://") or server.startswith("http://")):
                 return {"added": False, "message": "Server must be a valid HTTP/HTTPS URL"}
@@ -1845,29 +2471,45 @@ class ACPClient:
                     return {"added": False, "message": str(e)}
 
             # Update config
-            if "clusters" not in self.config:
-                self.config["clusters"] = {}
+            if "clusters" not in self._config:
+                self._config["clusters"] = {}
 
-            self.config["clusters"][name] = {
+            self._config["clusters"][name] = {
                 "server": server,
                 "description": description or "",
                 "default_project": default_project,
             }
 
             if set_default:
-                self.config["default_cluster"] = name
+                self._config["default_cluster"] = name
+            self._rebuild_cluster_index()
 
             # Save config securely
             config_file = Path(self.config_path)
             config_file.parent.mkdir(parents=True, exist_ok=True)
 
-            # Security: Write with restricted permissions
-            with open(config_file, "w") as f:
-                yaml.dump(self.config, f)
-            # Set file permissions to 0600 (owner read/write only)
-            import os
-
-            os.chmod(config_file, 0o600)
+            # Security: Create the file 0600 (owner read/write only) from the start, and
+            # swap it in atomically so a crash never leaves a truncated config behind.
+            # A leftover temp file is removed first: O_CREAT would keep its old mode.
+            tmp_file = config_file.with_name(config_file.name + ".tmp")
+            tmp_file.unlink(missing_ok=True)
+            fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+            try:
+                with os.fdopen(fd, "w") as f:
+                    yaml.dump(self._config, f, Dumper=_YamlDumper)
+                    # The data must be on disk before the rename makes it the config
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_file, config_file)
+            except BaseException:
+                tmp_file.unlink(missing_ok=True)
+                raise
+            # Persist the rename itself
+            dir_fd = os.open(config_file.parent, os.O_RDONLY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
 
             return {
                 "added": True,
@@ -1,7 +1,38 @@
 """Output formatters for MCP responses."""
 
 import json
-from typing import Any
+import re
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Any, Final
+
+# Static output fragments shared across formatters
+_DRY_RUN_HEADER: Final = "DRY RUN MODE - No changes made\n\n"
+_NO_CLUSTERS_MESSAGE: Final = "No clusters configured. Create ~/.config/acp/clusters.yaml to add clusters."
+
+# Shared read-only stand-in for missing sub-objects (avoids a throwaway {} per lookup)
+_EMPTY: Final = MappingProxyType({})
+
+# Shared pretty-printing encoder (json.dumps builds a new encoder on every call with indent set)
+_to_json = json.JSONEncoder(indent=2).encode
+
+# Error messages that describe an expected state rather than a failure, per formatter
+_LOGS_EXPECTED_RE = re.compile(r"no pods found|not found|no running pods", re.IGNORECASE)
+_TRANSCRIPT_EXPECTED_RE = re.compile(r"no transcript|transcript not found|no data", re.IGNORECASE)
+_METRICS_EXPECTED_RE = re.compile(r"no transcript|no data|not found", re.IGNORECASE)
+_WORKFLOWS_EXPECTED_RE = re.compile(r"no workflows|not found|no \.github/workflows", re.IGNORECASE)
+_EXPORT_PARTIAL_RE = re.compile(r"no transcript|no data|partially exported", re.IGNORECASE)
+
+# Bulk operation name -> result key listing the sessions it succeeded on
+_BULK_SUCCESS_KEYS = MappingProxyType(
+    {
+        "delete": "deleted",
+        "stop": "stopped",
+        "restart": "restarted",
+        "label": "labeled",
+        "unlabel": "unlabeled",
+    }
+)
 
 
 def format_result(result: dict[str, Any]) -> str:
@@ -14,13 +45,35 @@ def format_result(result: dict[str, Any]) -> str:
         Formatted string for display
     """
     if result.get("dry_run"):
-        output = "DRY RUN MODE - No changes made\n\n"
+        output = _DRY_RUN_HEADER
         output += result.get("message", "")
         if "session_info" in result:
-            output += f"\n\nSession Info:\n{json.dumps(result['session_info'], indent=2)}"
+            output += f"\n\nSession Info:\n{_to_json(result['session_info'])}"
         return output
 
-    return result.get("message", json.dumps(result, indent=2))
+    message = result.get("message")
+    return _to_json(result) if message is None else message
+
+
+def _format_session_row(session: dict[str, Any]) -> str:
+    """Format one AgenticSession for format_sessions_list.
+
+    Args:
+        session: AgenticSession resource (metadata/spec/status)
+
+    Returns:
+        Formatted session entry
+    """
+    metadata = session.get("metadata") or _EMPTY
+    display_name = (session.get("spec") or _EMPTY).get("displayName", "")
+    phase = (session.get("status") or _EMPTY).get("phase", "unknown")
+
+    label = f' ("{display_name}")' if display_name else ""
+    return (
+        f"\n- {metadata.get('name', 'unknown')}{label}\n"
+        f"  Status: {phase}\n"
+        f"  Created: {metadata.get('creationTimestamp', 'unknown')}\n"
+    )
 
 
 def format_sessions_list(result: dict[str, Any]) -> str:
@@ -32,30 +85,17 @@ def format_sessions_list(result: dict[str, Any]) -> str:
     Returns:
         Formatted string for display
     """
-    output = f"Found {result['total']} session(s)"
-
+    sessions = result["sessions"]
     filters = result.get("filters_applied", {})
-    if filters:
-        output += f"\nFilters applied: {json.dumps(filters, indent=2)}"
-
-    output += "\n\nSessions:\n"
+    header = f"Found {result['total']} session(s)" + (f"\nFilters applied: {_to_json(filters)}" if filters else "")
 
-    for session in result["sessions"]:
-        metadata = session.get("metadata", {})
-        spec = session.get("spec", {})
-        status = session.get("status", {})
+    if not sessions:
+        return f"{header}\n\nNo sessions.\n"
 
-        name = metadata.get("name", "unknown")
-        display_name = spec.get("displayName", "")
-        phase = status.get("phase", "unknown")
-        created = metadata.get("creationTimestamp", "unknown")
+    parts = [header, "\n\nSessions:\n"]
+    parts.extend(map(_format_session_row, sessions))
 
-        output += f"\n- {name}"
-        if display_name:
-            output += f' ("{display_name}")'
-        output += f"\n  Status: {phase}\n  Created: {created}\n"
-
-    return output
+    return "".join(parts)
 
 
 def format_bulk_result(result: dict[str, Any], operation: str) -> str:
@@ -69,19 +109,20 @@ def format_bulk_result(result: dict[str, Any], operation: str) -> str:
         Formatted string for display
     """
     if result.get("dry_run"):
-        output = "DRY RUN MODE - No changes made\n\n"
+        parts = [_DRY_RUN_HEADER]
+        append = parts.append
 
         # Handle enhanced dry-run for label-based operations
         if "matched_sessions" in result:
             matched = result.get("matched_sessions", [])
-            output += f"Matched {result.get('matched_count', len(matched))} sessions with label selector:\n"
-            output += f"  {result.get('label_selector', 'N/A')}\n\n"
+            append(f"Matched {result.get('matched_count', len(matched))} sessions with label selector:\n")
+            append(f"  {result.get('label_selector', 'N/A')}\n\n")
             if matched:
-                output += "Matched sessions:\n"
+                append("Matched sessions:\n")
                 for session in matched:
-                    output += f"  - {session}\n"
-            output += f"\n{result.get('message', '')}\n"
-            return output
+                    append(f"  - {session}\n")
+            append(f"\n{result.get('message', '')}\n")
+            return "".join(parts)
 
         dry_run_info = result.get("dry_run_info", {})
 
@@ -89,52 +130,43 @@ def format_bulk_result(result: dict[str, Any], operation: str) -> str:
         skipped = dry_run_info.get("skipped", [])
 
         if would_execute:
-            output += f"Would {operation} {len(would_execute)} session(s):\n"
+            append(f"Would {operation} {len(would_execute)} session(s):\n")
             for item in would_execute:
-                output += f"  - {item['session']}\n"
+                append(f"  - {item['session']}\n")
                 if item.get("info"):
                     info = item["info"]
                     if "status" in info:
-                        output += f"    Status: {info['status']}\n"
+                        append(f"    Status: {info['status']}\n")
 
         if skipped:
-            output += f"\nSkipped ({len(skipped)} session(s)):\n"
+            append(f"\nSkipped ({len(skipped)} session(s)):\n")
             for item in skipped:
-                output += f"  - {item['session']}"
-                if "reason" in item:
-                    output += f": {item['reason']}"
-                output += "\n"
+                reason = f": {item['reason']}" if "reason" in item else ""
+                append(f"  - {item['session']}{reason}\n")
 
-        return output
+        return "".join(parts)
 
     # Normal mode
-    # Map operation to success key
-    success_key_map = {
-        "delete": "deleted",
-        "stop": "stopped",
-        "restart": "restarted",
-        "label": "labeled",
-        "unlabel": "unlabeled",
-    }
-    success_key = success_key_map.get(operation, operation)
+    success_key = _BULK_SUCCESS_KEYS.get(operation, operation)
     success = result.get(success_key, [])
     failed = result.get("failed", [])
 
     # Determine if we're working with sessions or resources
     resource_type = "session(s)" if "session" in str(failed) else "resource(s)"
-    output = f"Successfully {operation}d {len(success)} {resource_type}"
+    parts = [f"Successfully {operation}d {len(success)} {resource_type}"]
+    append = parts.append
 
     if success:
-        output += ":\n"
+        append(":\n")
         for session in success:
-            output += f"  - {session}\n"
+            append(f"  - {session}\n")
 
     if failed:
-        output += f"\nFailed ({len(failed)} session(s)):\n"
+        append(f"\nFailed ({len(failed)} session(s)):\n")
         for item in failed:
-            output += f"  - {item['session']}: {item['error']}\n"
+            append(f"  - {item['session']}: {item['error']}\n")
 
-    return output
+    return "".join(parts)
 
 
 def format_logs(result: dict[str, Any]) -> str:
@@ -149,8 +181,7 @@ def format_logs(result: dict[str, Any]) -> str:
     if "error" in result:
         error_msg = result["error"]
         # Check if this is an expected state rather than an error
-        error_lower = error_msg.lower()
-        if any(phrase in error_lower for phrase in ["no pods found", "not found", "no running pods"]):
+        if _LOGS_EXPECTED_RE.search(error_msg):
             return f"No logs available: {error_msg}\n\nNote: This is expected for stopped sessions or sessions without active pods."
         return f"Error retrieving logs: {error_msg}"
 
@@ -174,27 +205,27 @@ def format_clusters(result: dict[str, Any]) -> str:
     default = result.get("default_cluster")
 
     if not clusters:
-        return "No clusters configured. Create ~/.config/acp/clusters.yaml to add clusters."
+        return _NO_CLUSTERS_MESSAGE
 
-    output = f"Configured Clusters (default: {default or 'none'}):\n\n"
+    parts = [f"Configured Clusters (default: {default or 'none'}):\n\n"]
+    append = parts.append
 
     for cluster in clusters:
         name = cluster["name"]
         is_default = cluster.get("is_default", False)
         marker = " [DEFAULT]" if is_default else ""
 
-        output += f"- {name}{marker}\n"
-        output += f"  Server: {cluster.get('server', 'N/A')}\n"
+        append(f"- {name}{marker}\n  Server: {cluster.get('server', 'N/A')}\n")
 
         if cluster.get("description"):
-            output += f"  Description: {cluster['description']}\n"
+            append(f"  Description: {cluster['description']}\n")
 
         if cluster.get("default_project"):
-            output += f"  Default Project: {cluster['default_project']}\n"
+            append(f"  Default Project: {cluster['default_project']}\n")
 
-        output += "\n"
+        append("\n")
 
-    return output
+    return "".join(parts)
 
 
 def format_whoami(result: dict[str, Any]) -> str:
@@ -239,9 +270,8 @@ def format_transcript(result: dict[str, Any]) -> str:
     """
     if "error" in result:
         error_msg = result["error"]
-        error_lower = error_msg.lower()
         # Check if this is an expected state (no transcript available)
-        if any(phrase in error_lower for phrase in ["no transcript", "transcript not found", "no data"]):
+        if _TRANSCRIPT_EXPECTED_RE.search(error_msg):
             return f"No transcript available: {error_msg}\n\nNote: Sessions may not have transcript data if they are newly created, stopped, or haven't processed messages yet."
         return f"Error retrieving transcript: {error_msg}"
 
@@ -257,7 +287,7 @@ def format_transcript(result: dict[str, Any]) -> str:
         return output
     else:
         output = f"Session Transcript ({message_count} messages):\n\n"
-        output += json.dumps(result.get("transcript", []), indent=2)
+        output += _to_json(result.get("transcript", []))
         return output
 
 
@@ -272,31 +302,33 @@ def format_metrics(result: dict[str, Any]) -> str:
     """
     if "error" in result:
         error_msg = result["error"]
-        error_lower = error_msg.lower()
         # Check if this is an expected state (no metrics available)
-        if any(phrase in error_lower for phrase in ["no transcript", "no data", "not found"]):
+        if _METRICS_EXPECTED_RE.search(error_msg):
             return f"No metrics available: {error_msg}\n\nNote: Metrics are calculated from transcript data. Sessions without transcript data (new, stopped, or inactive sessions) will not have metrics."
         return f"Error retrieving metrics: {error_msg}"
 
-    output = "Session Metrics:\n\n"
     message_count = result.get("message_count", 0)
 
     if message_count == 0:
-        output += "No metrics available yet.\n\nNote: This session has no message history. Metrics will be available after the session processes messages."
-        return output
+        return "Session Metrics:\n\nNo metrics available yet.\n\nNote: This session has no message history. Metrics will be available after the session processes messages."
 
-    output += f"Message Count: {message_count}\n"
-    output += f"Token Count (approx): {result.get('token_count', 0)}\n"
-    output += f"Duration: {result.get('duration_seconds', 0)} seconds\n"
-    output += f"Status: {result.get('status', 'unknown')}\n"
+    parts = [
+        "Session Metrics:\n\n",
+        f"Message Count: {message_count}\n",
+        f"Token Count (approx): {result.get('token_count', 0)}\n",
+        f"Duration: {result.get('duration_seconds', 0)} seconds\n",
+        f"Status: {result.get('status', 'unknown')}\n",
+    ]
 
     tool_calls = result.get("tool_calls", {})
     if tool_calls:
-        output += "\nTool Usage:\n"
-        for tool_name, count in sorted(tool_calls.items(), key=lambda x: x[1], reverse=True):
-            output += f"  - {tool_name}: {count}\n"
+        parts.append("\nTool Usage:\n")
+        parts.extend(
+            f"  - {tool_name}: {count}\n"
+            for tool_name, count in sorted(tool_calls.items(), key=itemgetter(1), reverse=True)
+        )
 
-    return output
+    return "".join(parts)
 
 
 def format_workflows(result: dict[str, Any]) -> str:
@@ -310,9 +342,8 @@ def format_workflows(result: dict[str, Any]) -> str:
     """
     if "error" in result:
         error_msg = result["error"]
-        error_lower = error_msg.lower()
         # Check if this is an expected state (no workflows found)
-        if any(phrase in error_lower for phrase in ["no workflows", "not found", "no .github/workflows"]):
+        if _WORKFLOWS_EXPECTED_RE.search(error_msg):
             return f"No workflows found: {error_msg}\n\nNote: This repository may not have GitHub Actions workflows configured yet."
         return f"Error retrieving workflows: {error_msg}"
 
@@ -323,17 +354,16 @@ def format_workflows(result: dict[str, Any]) -> str:
     if not workflows:
         return f"No workflows found in {repo_url}\n\nNote: This repository does not have any GitHub Actions workflows in .github/workflows/"
 
-    output = f"Available Workflows ({count} found):\n"
-    output += f"Repository: {repo_url}\n\n"
+    parts = [f"Available Workflows ({count} found):\nRepository: {repo_url}\n\n"]
+    append = parts.append
 
     for workflow in workflows:
-        output += f"- {workflow['name']}\n"
-        output += f"  Path: {workflow['path']}\n"
+        append(f"- {workflow['name']}\n  Path: {workflow['path']}\n")
         if workflow.get("description"):
-            output += f"  Description: {workflow['description']}\n"
-        output += "\n"
+            append(f"  Description: {workflow['description']}\n")
+        append("\n")
 
-    return output
+    return "".join(parts)
 
 
 def format_export(result: dict[str, Any]) -> str:
@@ -347,9 +377,8 @@ def format_export(result: dict[str, Any]) -> str:
     """
     if "error" in result:
         error_msg = result["error"]
-        error_lower = error_msg.lower()
         # Check if this is a partial export (some data unavailable)
-        if any(phrase in error_lower for phrase in ["no transcript", "no data", "partially exported"]):
+        if _EXPORT_PARTIAL_RE.search(error_msg):
             return f"Partial export: {error_msg}\n\nNote: Some session data may be unavailable for stopped or inactive sessions. Exported data reflects what was accessible."
         return f"Error exporting session: {error_msg}"
 
@@ -357,22 +386,21 @@ def format_export(result: dict[str, Any]) -> str:
         return result.get("message", "Export failed")
 
     data = result.get("data", {})
-    output = "Session Export:\n\n"
-    output += "Configuration:\n"
-    output += json.dumps(data.get("config", {}), indent=2)
-    output += "\n\nMetadata:\n"
-    output += json.dumps(data.get("metadata", {}), indent=2)
-
-    transcript = data.get("transcript", [])
-    transcript_count = len(transcript)
-    output += f"\n\nTranscript: {transcript_count} messages"
-
-    if transcript_count == 0:
-        output += " (no transcript data available - this is expected for new/stopped sessions)"
-
-    output += "\n\n" + result.get("message", "")
-
-    return output
+    transcript_count = len(data.get("transcript", []))
+    no_transcript_note = (
+        " (no transcript data available - this is expected for new/stopped sessions)" if transcript_count == 0 else ""
+    )
+
+    return "".join(
+        [
+            "Session Export:\n\nConfiguration:\n",
+            _to_json(data.get("config", {})),
+            "\n\nMetadata:\n",
+            _to_json(data.get("metadata", {})),
+            f"\n\nTranscript: {transcript_count} messages{no_transcript_note}\n\n",
+            result.get("message", ""),
+        ]
+    )
 
 
 def format_cluster_operation(result: dict[str, Any]) -> str:
@@ -384,4 +412,5 @@ def format_cluster_operation(result: dict[str, Any]) -> str:
     Returns:
         Formatted string for display
     """
-    return result.get("message", json.dumps(result, indent=2))
+    message = result.get("message")
+    return _to_json(result) if message is None else message
@@ -1,7 +1,11 @@
 """MCP server for Ambient Code Platform management."""
 
 import asyncio
+import functools
+import logging
 import os
+import threading
+import time
 from collections.abc import Callable
 from typing import Any
 
@@ -32,10 +36,20 @@ logger = get_python_logger()
 # Create MCP server instance
 app = Server("mcp-acp")
 
-# Global client instance
+# Tool arguments never written to the logs
+_SENSITIVE_ARGUMENTS = frozenset({"token", "password", "secret"})
+
+# Global client instance, created once by get_client (possibly on a worker thread, see main)
 _client: ACPClient | None = None
+_client_lock = threading.Lock()
+
+# Background task creating the client while the server starts serving (see main)
+_client_warmup: asyncio.Task | None = None
+
+# Dispatch table bound to the client it was built for: (client, table)
+_DISPATCH_CACHE: tuple[ACPClient, dict[str, tuple[Callable, Callable, bool, bool]]] | None = None
 
-# Schema fragments for reuse
+# Schema fragments for reuse (shared by reference between tool schemas - do not mutate)
 SCHEMA_FRAGMENTS = {
     "project": {
         "type": "string",
@@ -109,16 +123,16 @@ def create_tool_schema(properties: dict[str, Any], required: list[str]) -> dict[
     Returns:
         JSON schema dict
     """
+    # Fragments are shared between tool schemas rather than copied: schemas are only ever
+    # serialised, never mutated. (They stay plain dicts - pydantic can't serialise
+    # MappingProxyType values inside Tool.inputSchema.)
     schema_properties = {}
     for prop_name, fragment_key in properties.items():
         if isinstance(fragment_key, str) and fragment_key in SCHEMA_FRAGMENTS:
-            # Reference to a schema fragment - use a copy to avoid mutation
-            schema_properties[prop_name] = SCHEMA_FRAGMENTS[fragment_key].copy()
-        elif isinstance(fragment_key, dict):
-            # Inline schema definition - use a copy to avoid mutation
-            schema_properties[prop_name] = fragment_key.copy()
+            # Reference to a schema fragment
+            schema_properties[prop_name] = SCHEMA_FRAGMENTS[fragment_key]
         else:
-            # String reference not in fragments - treat as-is
+            # Inline schema definition, or string reference not in fragments - use as-is
             schema_properties[prop_name] = fragment_key
 
     return {
@@ -129,21 +143,31 @@ def create_tool_schema(properties: dict[str, Any], required: list[str]) -> dict[
 
 
 def get_client() -> ACPClient:
-    """Get or create ACP client instance with error handling."""
+    """Get or create ACP client instance with error handling.
+
+    Safe to call from any thread: construction is guarded by a lock, so only one client is
+    ever created, and once it exists it is returned without locking. A failed initialization
+    is not stored, so the next call retries.
+    """
     global _client
-    if _client is None:
-        config_path = os.getenv("ACP_CLUSTER_CONFIG")
-        try:
-            logger.info("acp_client_initializing", config_path=config_path or "default")
-            _client = ACPClient(config_path=config_path)
-            logger.info("acp_client_initialized")
-        except ValueError as e:
-            logger.error("acp_client_init_failed", error=str(e))
-            raise
-        except Exception as e:
-            logger.error("acp_client_init_unexpected_error", error=str(e), exc_info=True)
-            raise
-    return _client
+    client = _client
+    if client is not None:
+        return client
+
+    with _client_lock:
+        if _client is None:
+            config_path = os.getenv("ACP_CLUSTER_CONFIG")
+            try:
+                logger.info("acp_client_initializing", config_path=config_path or "default")
+                _client = ACPClient(config_path=config_path)
+                logger.info("acp_client_initialized")
+            except ValueError as e:
+                logger.error("acp_client_init_failed", error=str(e))
+                raise
+            except Exception as e:
+                logger.error("acp_client_init_unexpected_error", error=str(e), exc_info=True)
+                raise
+        return _client
 
 
 async def _check_confirmation_then_execute(fn: Callable, args: dict[str, Any], operation: str) -> Any:
@@ -160,14 +184,18 @@ async def _check_confirmation_then_execute(fn: Callable, args: dict[str, Any], o
     Raises:
         ValueError: If confirmation not provided for non-dry-run operations
     """
-    if not args.get("dry_run") and not args.get("confirm"):
+    if not args.pop("confirm", False) and not args.get("dry_run"):
         raise ValueError(f"Bulk {operation} requires explicit confirmation.\nAdd confirm=true to proceed.")
+    # 'confirm' is a server-layer flag: the client methods don't accept it
     return await fn(**args)
 
 
-@app.list_tools()
-async def list_tools() -> list[Tool]:
-    """List available ACP (Ambient Code Platform) tools for managing AgenticSession resources on OpenShift/Kubernetes."""
+def _build_tools() -> list[Tool]:
+    """Build the Tool definitions advertised by list_tools.
+
+    Returns:
+        List of Tool objects
+    """
     return [
         # P0 Priority Tools
         Tool(
@@ -576,6 +604,16 @@ async def list_tools() -> list[Tool]:
     ]
 
 
+# The tool definitions are static: build them once at import and hand out the same list
+_TOOLS: list[Tool] = _build_tools()
+
+
+@app.list_tools()
+async def list_tools() -> list[Tool]:
+    """List available ACP (Ambient Code Platform) tools for managing AgenticSession resources on OpenShift/Kubernetes."""
+    return _TOOLS
+
+
 # Async wrapper functions for confirmation-protected bulk operations
 def create_bulk_wrappers(client: ACPClient) -> dict[str, Callable]:
     """Create async wrapper functions for bulk operations with confirmation.
@@ -605,6 +643,12 @@ def create_bulk_wrappers(client: ACPClient) -> dict[str, Callable]:
     async def bulk_restart_by_label_wrapper(**args):
         return await _check_confirmation_then_execute(client.bulk_restart_sessions_by_label, args, "restart")
 
+    async def bulk_label_wrapper(**args):
+        return await _check_confirmation_then_execute(client.bulk_label_resources, args, "label")
+
+    async def bulk_unlabel_wrapper(**args):
+        return await _check_confirmation_then_execute(client.bulk_unlabel_resources, args, "unlabel")
+
     return {
         "bulk_delete": bulk_delete_wrapper,
         "bulk_stop": bulk_stop_wrapper,
@@ -612,22 +656,37 @@ def create_bulk_wrappers(client: ACPClient) -> dict[str, Callable]:
         "bulk_stop_by_label": bulk_stop_by_label_wrapper,
         "bulk_restart": bulk_restart_wrapper,
         "bulk_restart_by_label": bulk_restart_by_label_wrapper,
+        "bulk_label": bulk_label_wrapper,
+        "bulk_unlabel": bulk_unlabel_wrapper,
+    }
+
+
+# Tool dispatch table: maps tool names to (handler, formatter, is_async) entries
+# Tools that don't require a project parameter (cluster-level or config operations)
+TOOLS_WITHOUT_PROJECT = frozenset(
+    {
+        "acp_list_clusters",
+        "acp_whoami",
+        "acp_login",
+        "acp_switch_cluster",
+        "acp_add_cluster",
+        "acp_list_workflows",
     }
+)
 
 
-# Tool dispatch table: maps tool names to (handler, formatter) pairs
-def create_dispatch_table(client: ACPClient) -> dict[str, tuple[Callable, Callable]]:
+def create_dispatch_table(client: ACPClient) -> dict[str, tuple[Callable, Callable, bool, bool]]:
     """Create tool dispatch table.
 
     Args:
         client: ACP client instance
 
     Returns:
-        Dict mapping tool names to (handler, formatter) tuples
+        Dict mapping tool names to (handler, formatter, is_async, needs_project) tuples
     """
     bulk_wrappers = create_bulk_wrappers(client)
 
-    return {
+    handlers: dict[str, tuple[Callable, Callable]] = {
         "acp_delete_session": (
             client.delete_session,
             format_result,
@@ -642,11 +701,11 @@ def create_dispatch_table(client: ACPClient) -> dict[str, tuple[Callable, Callab
         ),
         "acp_bulk_delete_sessions": (
             bulk_wrappers["bulk_delete"],
-            lambda r: format_bulk_result(r, "delete"),
+            functools.partial(format_bulk_result, operation="delete"),
         ),
         "acp_bulk_stop_sessions": (
             bulk_wrappers["bulk_stop"],
-            lambda r: format_bulk_result(r, "stop"),
+            functools.partial(format_bulk_result, operation="stop"),
         ),
         "acp_get_session_logs": (
             client.get_session_logs,
@@ -670,12 +729,12 @@ def create_dispatch_table(client: ACPClient) -> dict[str, tuple[Callable, Callab
             format_result,
         ),
         "acp_bulk_label_resources": (
-            lambda **args: _check_confirmation_then_execute(client.bulk_label_resources, args, "label"),
-            lambda r: format_bulk_result(r, "label"),
+            bulk_wrappers["bulk_label"],
+            functools.partial(format_bulk_result, operation="label"),
         ),
         "acp_bulk_unlabel_resources": (
-            lambda **args: _check_confirmation_then_execute(client.bulk_unlabel_resources, args, "unlabel"),
-            lambda r: format_bulk_result(r, "unlabel"),
+            bulk_wrappers["bulk_unlabel"],
+            functools.partial(format_bulk_result, operation="unlabel"),
         ),
         "acp_list_sessions_by_label": (
             client.list_sessions_by_user_labels,
@@ -683,19 +742,19 @@ def create_dispatch_table(client: ACPClient) -> dict[str, tuple[Callable, Callab
         ),
         "acp_bulk_delete_sessions_by_label": (
             bulk_wrappers["bulk_delete_by_label"],
-            lambda r: format_bulk_result(r, "delete"),
+            functools.partial(format_bulk_result, operation="delete"),
         ),
         "acp_bulk_stop_sessions_by_label": (
             bulk_wrappers["bulk_stop_by_label"],
-            lambda r: format_bulk_result(r, "stop"),
+            functools.partial(format_bulk_result, operation="stop"),
         ),
         "acp_bulk_restart_sessions": (
             bulk_wrappers["bulk_restart"],
-            lambda r: format_bulk_result(r, "restart"),
+            functools.partial(format_bulk_result, operation="restart"),
         ),
         "acp_bulk_restart_sessions_by_label": (
             bulk_wrappers["bulk_restart_by_label"],
-            lambda r: format_bulk_result(r, "restart"),
+            functools.partial(format_bulk_result, operation="restart"),
         ),
         # P2 Tools
         "acp_clone_session": (
@@ -742,16 +801,26 @@ def create_dispatch_table(client: ACPClient) -> dict[str, tuple[Callable, Callab
         ),
     }
 
+    # Decide once per handler whether it must be awaited and whether it takes a project
+    return {
+        name: (handler, formatter, asyncio.iscoroutinefunction(handler), name not in TOOLS_WITHOUT_PROJECT)
+        for name, (handler, formatter) in handlers.items()
+    }
 
-# Tools that don't require a project parameter (cluster-level or config operations)
-TOOLS_WITHOUT_PROJECT = {
-    "acp_list_clusters",
-    "acp_whoami",
-    "acp_login",
-    "acp_switch_cluster",
-    "acp_add_cluster",
-    "acp_list_workflows",
-}
+
+def get_dispatch_table(client: ACPClient) -> dict[str, tuple[Callable, Callable, bool, bool]]:
+    """Get the dispatch table for a client, building it only when the client changes.
+
+    Args:
+        client: ACP client instance
+
+    Returns:
+        Dict mapping tool names to (handler, formatter, is_async, needs_project) tuples
+    """
+    global _DISPATCH_CACHE
+    if _DISPATCH_CACHE is None or _DISPATCH_CACHE[0] is not client:
+        _DISPATCH_CACHE = (client, create_dispatch_table(client))
+    return _DISPATCH_CACHE[1]
 
 
 @app.call_tool()
@@ -765,66 +834,65 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
     Returns:
         List of text content responses
     """
-    import time
-
-    start_time = time.time()
+    start_time = time.monotonic()
 
     # Security: Sanitize arguments for logging (remove sensitive data)
-    safe_args = {k: v for k, v in arguments.items() if k not in ["token", "password", "secret"]}
-    logger.info("tool_call_started", tool=name, arguments=safe_args)
+    if logger.isEnabledFor(logging.INFO):
+        safe_args = {k: v for k, v in arguments.items() if k not in _SENSITIVE_ARGUMENTS}
+        logger.info("tool_call_started", tool=name, arguments=safe_args)
 
+    # Wait for the startup warm-up instead of blocking the event loop on the client lock
+    if _client_warmup is not None and not _client_warmup.done():
+        await _client_warmup
     client = get_client()
-    dispatch_table = create_dispatch_table(client)
+    dispatch_table = get_dispatch_table(client)
 
     try:
-        handler, formatter = dispatch_table.get(name, (None, None))
-
-        if not handler:
+        entry = dispatch_table.get(name)
+        if entry is None:
             logger.warning("unknown_tool_requested", tool=name)
             return [TextContent(type="text", text=f"Unknown tool: {name}")]
+        handler, formatter, is_async, needs_project = entry
 
         # Auto-fill project from default_project if not provided or empty
         # Only for tools that actually use project parameter
-        if name not in TOOLS_WITHOUT_PROJECT and not arguments.get("project"):
-            # Get default project from current cluster config
-            default_cluster = client.config.get("default_cluster")
-            if default_cluster:
-                cluster_config = client.config.get("clusters", {}).get(default_cluster, {})
-                default_project = cluster_config.get("default_project")
-                if default_project:
-                    arguments["project"] = default_project
-                    logger.info("project_autofilled", project=default_project, cluster=default_cluster)
+        if needs_project and not arguments.get("project"):
+            # Default project of the default cluster, resolved by the client when its config changes
+            default_project = client.default_project
+            if default_project:
+                arguments["project"] = default_project
+                logger.info("project_autofilled", project=default_project, cluster=client.config.get("default_cluster"))
 
         # Call handler (async or sync)
-        if asyncio.iscoroutinefunction(handler):
+        if is_async:
             result = await handler(**arguments)
         else:
             result = handler(**arguments)
 
-        # Log execution time
-        elapsed = time.time() - start_time
-        logger.info("tool_call_completed", tool=name, elapsed_seconds=round(elapsed, 2))
+        # Log execution time (skip the clock read and rounding when INFO is filtered out)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("tool_call_completed", tool=name, elapsed_seconds=round(time.monotonic() - start_time, 2))
 
         # Check for errors in result
         if isinstance(result, dict):
-            if result.get("error"):
-                logger.warning("tool_returned_error", tool=name, error=result.get("error"))
+            if error := result.get("error"):
+                logger.warning("tool_returned_error", tool=name, error=error)
             elif not result.get("success", True) and "message" in result:
-                logger.warning("tool_failed", tool=name, message=result.get("message"))
+                logger.warning("tool_failed", tool=name, message=result["message"])
 
         return [TextContent(type="text", text=formatter(result))]
 
     except ValueError as e:
         # Validation errors - these are expected for invalid input
-        elapsed = time.time() - start_time
+        elapsed = time.monotonic() - start_time
         logger.warning("tool_validation_error", tool=name, elapsed_seconds=round(elapsed, 2), error=str(e))
         return [TextContent(type="text", text=f"Validation Error: {str(e)}")]
     except TimeoutError as e:
-        elapsed = time.time() - start_time
+        elapsed = time.monotonic() - start_time
         logger.error("tool_timeout", tool=name, elapsed_seconds=round(elapsed, 2), error=str(e))
         return [TextContent(type="text", text=f"Timeout Error: {str(e)}")]
     except Exception as e:
-        elapsed = time.time() - start_time
+        elapsed = time.monotonic() - start_time
         logger.error(
             "tool_unexpected_error",
             tool=name,
@@ -835,14 +903,32 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
         return [TextContent(type="text", text=f"Error: {str(e)}")]
 
 
+async def _warm_up_client() -> None:
+    """Create the ACP client off the event loop."""
+    try:
+        await asyncio.to_thread(get_client)
+    except Exception:
+        # Already logged by get_client; the first tool call retries and reports the error
+        pass
+
+
 async def main() -> None:
     """Run the MCP server."""
-    async with stdio_server() as (read_stream, write_stream):
-        await app.run(
-            read_stream,
-            write_stream,
-            app.create_initialization_options(),
-        )
+    global _client_warmup
+    # Load the config in the background so the server can answer initialize/list_tools right away,
+    # and the first tool call doesn't pay for it
+    _client_warmup = asyncio.create_task(_warm_up_client())
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await app.run(
+                read_stream,
+                write_stream,
+                app.create_initialization_options(),
+            )
+    finally:
+        await _client_warmup
+        if _client is not None:
+            await _client.close()
 
 
 def run() -> None:
@@ -11,6 +11,11 @@ from pydantic_settings import BaseSettings
 
 from utils.pylogger import get_python_logger
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
 logger = get_python_logger()
 
 
@@ -106,7 +111,7 @@ class ClustersConfig(BaseSettings):
 
         try:
             with open(path) as f:
-                data = yaml.safe_load(f)
+                data = yaml.load(f, Loader=_YamlLoader)
 
             if not data:
                 raise ValueError("Cluster configuration is empty")
@@ -147,6 +152,10 @@ class Settings(BaseSettings):
         timeout_default: Default timeout for oc commands (seconds)
         max_log_lines: Maximum log lines to retrieve
         max_file_size: Maximum file size for exports (bytes)
+        bulk_concurrency: Maximum concurrent oc commands during bulk operations
+        cache_ttl_seconds: How long oc read results are cached (0 disables caching)
+        use_api_proxy: Serve reads through a long-lived 'oc proxy' instead of one oc process each
+        oc_binary: oc executable name (looked up on PATH) or absolute path
     """
 
     config_path: Path = Field(
@@ -176,6 +185,26 @@ class Settings(BaseSettings):
         le=100 * 1024 * 1024,  # 100MB
         description="Maximum file size for exports (bytes)",
     )
+    bulk_concurrency: int = Field(
+        default=8,
+        ge=1,
+        le=64,
+        description="Maximum concurrent oc commands during bulk operations",
+    )
+    cache_ttl_seconds: float = Field(
+        default=5.0,
+        ge=0,
+        le=300,
+        description="How long oc read results are cached (seconds, 0 disables caching)",
+    )
+    use_api_proxy: bool = Field(
+        default=False,
+        description="Serve reads through a long-lived 'oc proxy' instead of one oc process each",
+    )
+    oc_binary: str = Field(
+        default="oc",
+        description="oc executable name (looked up on PATH) or absolute path",
+    )
 
     @field_validator("log_level")
     @classmethod
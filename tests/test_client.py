@@ -1,6 +1,9 @@
 """Tests for ACP client."""
 
+import asyncio
 import json
+import subprocess
+import time
 from datetime import datetime, timedelta
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -55,6 +58,21 @@ class TestACPClient:
         assert "prod-cluster" in client.config["clusters"]
         assert client.config["default_cluster"] == "test-cluster"
 
+    def test_oc_binary_resolved_once(self, client: ACPClient) -> None:
+        """Test the oc binary is resolved to an absolute path at init when available."""
+        with patch("mcp_acp.client.shutil.which", return_value="/usr/local/bin/oc") as mock_which:
+            resolved = ACPClient(config_path=client.config_path)
+
+        mock_which.assert_called_once_with("oc")
+        assert resolved._oc_bin == "/usr/local/bin/oc"
+
+    def test_config_is_read_only(self, client: ACPClient) -> None:
+        """Test the raw config can't be modified behind the client's back."""
+        with pytest.raises(TypeError):
+            client.config["default_cluster"] = "prod-cluster"
+        with pytest.raises(TypeError):
+            client.config["clusters"]["test-cluster"]["server"] = "https://evil.example.com"
+
     def test_parse_time_delta(self, client: ACPClient) -> None:
         """Test time delta parsing."""
         now = datetime.utcnow()
@@ -97,60 +115,49 @@ class TestACPClient:
     @pytest.mark.asyncio
     async def test_list_sessions_basic(self, client: ACPClient) -> None:
         """Test basic session listing."""
-        mock_response = {
-            "items": [
-                {
-                    "metadata": {
-                        "name": "session-1",
-                        "creationTimestamp": "2024-01-20T10:00:00Z",
-                    },
-                    "spec": {"displayName": "Test Session"},
-                    "status": {"phase": "running"},
-                },
-                {
-                    "metadata": {
-                        "name": "session-2",
-                        "creationTimestamp": "2024-01-21T10:00:00Z",
-                    },
-                    "spec": {},
-                    "status": {"phase": "stopped"},
-                },
-            ]
-        }
+        # Tab-separated, URL-query-escaped projection: name, creationTimestamp, phase, stoppedAt, displayName
+        mock_output = (
+            b"session-1\t2024-01-20T10%3A00%3A00Z\trunning\t\tTest+Session\n"
+            b"session-2\t2024-01-21T10%3A00%3A00Z\tstopped\t\t\n"
+        )
 
         with patch.object(
             client,
             "_run_oc_command",
             new_callable=AsyncMock,
-            return_value=MagicMock(returncode=0, stdout=json.dumps(mock_response).encode()),
-        ):
+            return_value=MagicMock(returncode=0, stdout=mock_output),
+        ) as mock_cmd:
             result = await client.list_sessions(project="test-project")
 
+            assert mock_cmd.call_args[0][0][-1].startswith("go-template=")
+            assert result["sessions"][0]["spec"]["displayName"] == "Test Session"
+            assert result["sessions"][0]["metadata"]["creationTimestamp"] == "2024-01-20T10:00:00Z"
+            assert "spec" not in result["sessions"][1]
             assert result["total"] == 2
             assert len(result["sessions"]) == 2
             assert result["filters_applied"] == {}
 
+    def test_iter_projected_items_escaped_free_text(self) -> None:
+        """Test tabs and newlines in a display name can't fake extra rows or shift columns."""
+        # displayName "x\n\tfake\t\t\t" as escaped by the go-template urlquery function
+        output = "s1\t\trunning\t\tx%0A%09fake%09%09%09\ns2\t\tstopped\t\t\n"
+
+        items = list(ACPClient._iter_projected_items(output, ACPClient.SESSION_LIST_FIELDS))
+
+        assert [item["metadata"]["name"] for item in items] == ["s1", "s2"]
+        assert items[0]["spec"]["displayName"] == "x\n\tfake\t\t\t"
+        assert items[1]["status"]["phase"] == "stopped"
+
     @pytest.mark.asyncio
     async def test_list_sessions_with_status_filter(self, client: ACPClient) -> None:
         """Test session listing with status filter."""
-        mock_response = {
-            "items": [
-                {
-                    "metadata": {"name": "session-1"},
-                    "status": {"phase": "running"},
-                },
-                {
-                    "metadata": {"name": "session-2"},
-                    "status": {"phase": "stopped"},
-                },
-            ]
-        }
+        mock_output = b"session-1\t\trunning\t\t\nsession-2\t\tstopped\t\t\n"
 
         with patch.object(
             client,
             "_run_oc_command",
             new_callable=AsyncMock,
-            return_value=MagicMock(returncode=0, stdout=json.dumps(mock_response).encode()),
+            return_value=MagicMock(returncode=0, stdout=mock_output),
         ):
             result = await client.list_sessions(project="test-project", status="running")
 
@@ -161,13 +168,13 @@ class TestACPClient:
     @pytest.mark.asyncio
     async def test_list_sessions_with_limit(self, client: ACPClient) -> None:
         """Test session listing with limit."""
-        mock_response = {"items": [{"metadata": {"name": f"session-{i}"}} for i in range(10)]}
+        mock_output = "".join(f"session-{i}\t\t\t\t\n" for i in range(10)).encode()
 
         with patch.object(
             client,
             "_run_oc_command",
             new_callable=AsyncMock,
-            return_value=MagicMock(returncode=0, stdout=json.dumps(mock_response).encode()),
+            return_value=MagicMock(returncode=0, stdout=mock_output),
         ):
             result = await client.list_sessions(project="test-project", limit=5)
 
@@ -213,25 +220,17 @@ class TestACPClient:
     @pytest.mark.asyncio
     async def test_restart_session_success(self, client: ACPClient) -> None:
         """Test successful session restart."""
-        mock_session = {
-            "metadata": {"name": "test-session"},
-            "status": {"phase": "stopped"},
-        }
-
         with patch.object(
             client,
             "_run_oc_command",
             new_callable=AsyncMock,
+            return_value=MagicMock(returncode=0, stderr=b""),
         ) as mock_cmd:
-            # First call: get session status
-            # Second call: patch session
-            mock_cmd.side_effect = [
-                MagicMock(returncode=0, stdout=json.dumps(mock_session).encode()),
-                MagicMock(returncode=0, stderr=b""),
-            ]
-
             result = await client.restart_session(project="test-project", session="test-session")
 
+            # Single patch call, no preliminary GET
+            mock_cmd.assert_called_once()
+            assert mock_cmd.call_args[0][0][0] == "patch"
             assert result["status"] == "restarting"
             assert "Successfully restarted" in result["message"]
 
@@ -255,57 +254,443 @@ class TestACPClient:
             assert "Would restart" in result["message"]
             assert result["session_info"]["current_status"] == "stopped"
 
+    @pytest.mark.asyncio
+    async def test_get_resource_json_cached(self, client: ACPClient) -> None:
+        """Test repeated reads are served from cache until invalidated."""
+        mock_session = {"metadata": {"name": "test-session"}}
+
+        with patch.object(
+            client,
+            "_run_oc_command",
+            new_callable=AsyncMock,
+            return_value=MagicMock(returncode=0, stdout=json.dumps(mock_session).encode()),
+        ) as mock_cmd:
+            first, second = await asyncio.gather(
+                client._get_resource_json("agenticsession", "test-session", "test-project"),
+                client._get_resource_json("agenticsession", "test-session", "test-project"),
+            )
+
+            assert first == second == mock_session
+            assert first is not second
+            assert mock_cmd.call_count == 1
+
+            client._invalidate_cache("test-project")
+            await client._get_resource_json("agenticsession", "test-session", "test-project")
+
+            assert mock_cmd.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_write_invalidates_cache_after_command(self, client: ACPClient) -> None:
+        """Test a read cached while a write is running is dropped once the write finishes."""
+        stale = subprocess.CompletedProcess(args=[], returncode=0, stdout=b"{}")
+
+        async def communicate(_input: bytes | None) -> tuple[bytes, bytes]:
+            # A concurrent read caches the pre-write object mid-command
+            client._cache[("agenticsession", "s1", "test-project")] = (time.monotonic(), stale)
+            return b"", b""
+
+        process = MagicMock(returncode=0, communicate=communicate)
+        with patch("asyncio.create_subprocess_exec", new_callable=AsyncMock, return_value=process):
+            await client._run_oc_command(["delete", "agenticsession", "s1", "-n", "test-project"])
+
+        assert client._cache == {}
+
+    @pytest.mark.asyncio
+    async def test_cache_is_bounded(self, client: ACPClient) -> None:
+        """Test the read cache evicts its oldest entries beyond MAX_CACHE_ENTRIES."""
+        client.MAX_CACHE_ENTRIES = 2
+        fetch = AsyncMock(return_value=subprocess.CompletedProcess(args=[], returncode=0, stdout=b"{}"))
+
+        for name in ("a", "b", "c"):
+            await client._cached_get(("agenticsession", name, "test-project"), fetch)
+
+        assert list(client._cache) == [("agenticsession", "b", "test-project"), ("agenticsession", "c", "test-project")]
+        assert ("agenticsession", "a", "test-project") not in client._cache_locks
+
+    @pytest.mark.asyncio
+    async def test_get_resource_json_via_api_proxy(self, client: ACPClient) -> None:
+        """Test reads use the API proxy when enabled and fall back to oc when it's unusable."""
+        client.settings.use_api_proxy = True
+        client.settings.cache_ttl_seconds = 0
+        mock_session = {"metadata": {"name": "test-session"}}
+        proxied = subprocess.CompletedProcess(
+            args=["GET", "/path"], returncode=0, stdout=json.dumps(mock_session).encode(), stderr=b""
+        )
+
+        with (
+            patch.object(client, "_api_get", new_callable=AsyncMock, side_effect=[proxied, None]) as mock_api,
+            patch.object(
+                client,
+                "_run_oc_command",
+                new_callable=AsyncMock,
+                return_value=MagicMock(returncode=0, stdout=json.dumps(mock_session).encode()),
+            ) as mock_cmd,
+        ):
+            assert await client._get_resource_json("agenticsession", "test-session", "test-project") == mock_session
+            mock_cmd.assert_not_called()
+            assert mock_api.call_args[0][0] == (
+                "/apis/vteam.ambient-code/v1alpha1/namespaces/test-project/agenticsessions/test-session"
+            )
+
+            assert await client._get_resource_json("agenticsession", "test-session", "test-project") == mock_session
+            mock_cmd.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_stop_api_proxy_waits_for_proxy_lock(self, client: ACPClient) -> None:
+        """Test stopping the proxy (e.g. on login) is serialized with starting it."""
+        http = AsyncMock()
+        client._http = http
+
+        async with client._proxy_lock:
+            stop = asyncio.create_task(client._stop_api_proxy())
+            await asyncio.sleep(0)
+            assert client._http is http
+            http.close.assert_not_called()
+
+        await stop
+        assert client._http is None
+        http.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_update_session_via_api_proxy(self, client: ACPClient) -> None:
+        """Test update_session sends its merge patch through the API proxy when enabled."""
+        client.settings.use_api_proxy = True
+        mock_session = {"metadata": {"name": "test-session"}, "spec": {"displayName": "Renamed"}}
+        patched = subprocess.CompletedProcess(
+            args=["PATCH", "/path"], returncode=0, stdout=json.dumps(mock_session).encode(), stderr=b""
+        )
+
+        with (
+            patch.object(client, "_get_resource_json", new_callable=AsyncMock, return_value=mock_session) as mock_get,
+            patch.object(client, "_api_merge_patch", new_callable=AsyncMock, return_value=patched) as mock_patch,
+            patch.object(client, "_run_oc_command", new_callable=AsyncMock) as mock_cmd,
+        ):
+            result = await client.update_session("test-project", "test-session", display_name="Renamed")
+
+            assert result["updated"] is True
+            assert result["session"] == mock_session
+            mock_cmd.assert_not_called()
+            mock_get.assert_not_called()
+            assert mock_patch.call_args[0][1] == '{"spec":{"displayName":"Renamed"}}'
+
+            result = await client.update_session("test-project", "test-session")
+
+            assert result["updated"] is False
+            assert mock_patch.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_export_session_single_read(self, client: ACPClient) -> None:
+        """Test export_session reads the session once and takes the transcript from it."""
+        transcript = [{"role": "user", "content": "hello"}]
+        mock_session = {"metadata": {"name": "test-session"}, "spec": {}, "status": {"transcript": transcript}}
+
+        with patch.object(client, "_get_resource_json", new_callable=AsyncMock, return_value=mock_session) as mock_get:
+            result = await client.export_session("test-project", "test-session")
+
+            assert result["exported"] is True
+            assert result["data"]["transcript"] == transcript
+            assert result["data"]["metadata"]["messageCount"] == 1
+            mock_get.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_get_session_metrics(self, client: ACPClient) -> None:
+        """Test session metrics count words and tool calls from the transcript."""
+        transcript = [
+            {"role": "user", "content": "list the files please"},
+            {"role": "assistant", "content": "done", "tool_calls": [{"name": "bash"}, {"name": "bash"}, {}]},
+        ]
+        mock_session = {
+            "metadata": {"creationTimestamp": "2024-01-01T00:00:00Z"},
+            "status": {"phase": "Stopped", "stoppedAt": "2024-01-01T00:02:00Z", "transcript": transcript},
+        }
+
+        with patch.object(client, "_get_resource_json", new_callable=AsyncMock, return_value=mock_session):
+            result = await client.get_session_metrics("test-project", "test-session")
+
+        assert result["token_count"] == 6
+        assert result["tool_calls"] == {"bash": 2, "unknown": 1}
+        assert result["message_count"] == 2
+        assert result["duration_seconds"] == 120
+
+    def test_read_workflow_description(self, tmp_path: Path) -> None:
+        """Test workflow descriptions are read from single-line keys, continued plain scalars and block scalars."""
+        simple = tmp_path / "simple.yaml"
+        simple.write_text('name: x\ndescription: "Fix bugs"\nsteps: [a, b]\n')
+        folded = tmp_path / "folded.yaml"
+        folded.write_text("description: >\n  Multi\n  line\n")
+        continued = tmp_path / "continued.yaml"
+        continued.write_text("description: Fix\n  bugs fast\nname: x\n")
+        missing = tmp_path / "missing.yaml"
+        missing.write_text("- not\n- a mapping\n")
+
+        assert ACPClient._read_workflow_description(simple) == "Fix bugs"
+        assert ACPClient._read_workflow_description(folded) == "Multi line\n"
+        assert ACPClient._read_workflow_description(continued) == "Fix bugs fast"
+        assert ACPClient._read_workflow_description(missing) == ""
+
+    def test_read_workflow_description_matches_yaml(self, tmp_path: Path) -> None:
+        """Test duplicate keys follow YAML (last wins) and malformed files are rejected and skipped."""
+        duplicate = tmp_path / "duplicate.yaml"
+        duplicate.write_text("description: first\nname: x\ndescription: last\n")
+        malformed = tmp_path / "malformed.yaml"
+        malformed.write_text("description: Looks fine\nsteps: [a, b\n")
+
+        assert ACPClient._read_workflow_description(duplicate) == "last"
+        with pytest.raises(yaml.YAMLError):
+            ACPClient._read_workflow_description(malformed)
+        assert [w["name"] for w in ACPClient._scan_workflows(str(tmp_path))] == ["duplicate"]
+
+    def test_iter_workflow_files(self, tmp_path: Path) -> None:
+        """Test the workflow walker recurses but does not follow directory symlinks."""
+        root = tmp_path / "workflows"
+        (root / "nested").mkdir(parents=True)
+        (root / "top.yaml").write_text("description: top\n")
+        (root / "nested" / "deep.yaml").write_text("description: deep\n")
+        (root / "README.md").write_text("docs\n")
+        outside = tmp_path / "outside"
+        outside.mkdir()
+        (outside / "secret.yaml").write_text("description: secret\n")
+        (root / "linked").symlink_to(outside, target_is_directory=True)
+
+        names = sorted(entry.name for entry in ACPClient._iter_workflow_files(str(root)))
+
+        assert names == ["deep.yaml", "top.yaml"]
+
+        scanned = sorted(ACPClient._scan_workflows(str(root)), key=lambda w: w["name"])
+        assert scanned == [
+            {"name": "deep", "path": "nested/deep.yaml", "description": "deep"},
+            {"name": "top", "path": "top.yaml", "description": "top"},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_sync_workflow_checkout_reuses_clone(self, client: ACPClient, tmp_path: Path) -> None:
+        """Test workflow repositories are cloned once and only updated when HEAD moves."""
+        repo = tmp_path / "repo"
+        (repo / "workflows").mkdir(parents=True)
+        (repo / "workflows" / "a.yaml").write_text("description: a\n")
+
+        def git(*args: str) -> None:
+            subprocess.run(
+                ["git", "-c", "user.name=t", "-c", "user.email=t@example.com", "-C", str(repo), *args],
+                check=True,
+                capture_output=True,
+            )
+
+        git("init", "-q")
+        git("add", ".")
+        git("commit", "-qm", "one")
+        url = repo.as_uri()
+
+        checkout = await client._sync_workflow_checkout(url)
+        assert await client._sync_workflow_checkout(url) == checkout
+
+        (repo / "workflows" / "b.yaml").write_text("description: b\n")
+        git("add", ".")
+        git("commit", "-qm", "two")
+
+        # Within the cache TTL the remote is not checked again
+        assert await client._sync_workflow_checkout(url) == checkout
+        assert not (Path(checkout) / "workflows" / "b.yaml").exists()
+
+        client.settings.cache_ttl_seconds = 0
+        assert await client._sync_workflow_checkout(url) == checkout
+        assert (Path(checkout) / "workflows" / "b.yaml").exists()
+
+        # Beyond MAX_WORKFLOW_CHECKOUTS the least recently used checkout is deleted
+        client.MAX_WORKFLOW_CHECKOUTS = 1
+        other = await client._sync_workflow_checkout(str(repo))
+        assert other != checkout
+        assert not Path(checkout).exists()
+        assert list(client._workflow_checkouts) == [str(repo)]
+        client._remove_workflow_checkouts()
+        assert not Path(other).exists()
+
+    def test_format_transcript_markdown(self) -> None:
+        """Test markdown transcripts render each message with its role and timestamp."""
+        transcript = [
+            {"role": "user", "content": "hi", "timestamp": "2024-01-01T00:00:00Z"},
+            {"role": "assistant", "content": "hello"},
+        ]
+
+        result = ACPClient._format_transcript(transcript, "test-session", "markdown")
+
+        assert result["message_count"] == 2
+        assert result["transcript"] == (
+            "# Session Transcript: test-session\n\n"
+            "## Message 1 - user\n*2024-01-01T00:00:00Z*\n\nhi\n\n---\n\n"
+            "## Message 2 - assistant\nhello\n\n---\n\n"
+        )
+
+    @pytest.mark.asyncio
+    async def test_clone_session_error_result(self, client: ACPClient) -> None:
+        """Test unexpected errors are returned as the method's error result."""
+        with patch.object(client, "_get_resource_json", new_callable=AsyncMock, side_effect=Exception("boom")):
+            result = await client.clone_session("test-project", "test-session", "Copy")
+
+        assert result == {"cloned": False, "message": "boom"}
+
     @pytest.mark.asyncio
     async def test_bulk_delete_sessions(self, client: ACPClient) -> None:
-        """Test bulk session deletion."""
+        """Test bulk session deletion uses a single oc invocation."""
         sessions = ["session-1", "session-2", "session-3"]
 
-        with patch.object(client, "delete_session", new_callable=AsyncMock) as mock_delete:
-            # Simulate 2 successful and 1 failed deletion
-            mock_delete.side_effect = [
-                {"deleted": True, "message": "Success"},
-                {"deleted": True, "message": "Success"},
-                {"deleted": False, "message": "Session not found"},
-            ]
+        mock_result = MagicMock(
+            returncode=1,
+            stdout=b"agenticsession.vteam.ambient-code/session-1\nagenticsession.vteam.ambient-code/session-2\n",
+            stderr=b'Error from server (NotFound): agenticsessions.vteam.ambient-code "session-3" not found\n',
+        )
 
+        with patch.object(client, "_run_oc_command", new_callable=AsyncMock, return_value=mock_result) as mock_run:
             result = await client.bulk_delete_sessions(project="test-project", sessions=sessions)
 
-            assert len(result["deleted"]) == 2
+            mock_run.assert_called_once()
+            args = mock_run.call_args[0][0]
+            assert args[:5] == ["delete", "agenticsession", "session-1", "session-2", "session-3"]
+            assert result["deleted"] == ["session-1", "session-2"]
             assert len(result["failed"]) == 1
             assert result["failed"][0]["session"] == "session-3"
+            assert "not found" in result["failed"][0]["error"]
 
     @pytest.mark.asyncio
-    async def test_bulk_stop_sessions(self, client: ACPClient) -> None:
-        """Test bulk session stop."""
-        sessions = ["session-1", "session-2"]
+    async def test_bulk_restart_sessions(self, client: ACPClient) -> None:
+        """Test bulk restart patches all sessions in a single oc invocation."""
+        mock_result = MagicMock(
+            returncode=0,
+            stdout=b"agenticsession.vteam.ambient-code/s1\nagenticsession.vteam.ambient-code/s2\n",
+            stderr=b"",
+        )
+
+        with patch.object(client, "_run_oc_command", new_callable=AsyncMock, return_value=mock_result) as mock_run:
+            result = await client.bulk_restart_sessions(project="test-project", sessions=["s1", "s2"])
+
+            mock_run.assert_called_once()
+            args = mock_run.call_args[0][0]
+            assert args[:4] == ["patch", "agenticsession", "s1", "s2"]
+            assert client.PATCH_START in args
+            assert result == {"restarted": ["s1", "s2"], "failed": [], "dry_run": False}
 
-        mock_session = {
-            "metadata": {"name": "session-1"},
-            "status": {"phase": "running"},
+    @pytest.mark.asyncio
+    async def test_bulk_session_operations_share_response_shape(self, client: ACPClient) -> None:
+        """Test bulk delete, stop and restart return the same keys for real runs and for dry runs."""
+        operations = {
+            "deleted": client.bulk_delete_sessions,
+            "stopped": client.bulk_stop_sessions,
+            "restarted": client.bulk_restart_sessions,
         }
+        mock_result = MagicMock(returncode=0, stdout=b"agenticsession.vteam.ambient-code/s1\n", stderr=b"")
+        mock_session = {"metadata": {"name": "s1"}, "status": {"phase": "running"}}
+
+        for success_key, operation in operations.items():
+            with patch.object(client, "_run_oc_command", new_callable=AsyncMock, return_value=mock_result):
+                result = await operation(project="test-project", sessions=["s1"])
+            assert result == {success_key: ["s1"], "failed": [], "dry_run": False}
 
+            with patch.object(client, "_get_resource_json", new_callable=AsyncMock, return_value=mock_session):
+                result = await operation(project="test-project", sessions=["s1"], dry_run=True)
+            assert set(result) == {success_key, "failed", "dry_run", "dry_run_info"}
+            assert result["dry_run"] is True
+            assert [item["session"] for item in result["dry_run_info"]["would_execute"]] == ["s1"]
+
+    @pytest.mark.asyncio
+    async def test_bulk_delete_sessions_dry_run_isolates_exceptions(self, client: ACPClient) -> None:
+        """Test that an exception for one session doesn't abort the others."""
         with (
-            patch.object(
-                client,
-                "_get_resource_json",
-                new_callable=AsyncMock,
-                return_value=mock_session,
-            ),
-            patch.object(
-                client,
-                "_run_oc_command",
-                new_callable=AsyncMock,
-                return_value=MagicMock(returncode=0, stderr=b""),
-            ),
+            patch.object(client, "_list_resources_json", new_callable=AsyncMock, side_effect=Exception("forbidden")),
+            patch.object(client, "delete_session", new_callable=AsyncMock) as mock_delete,
         ):
+            mock_delete.side_effect = [
+                {"dry_run": True, "success": True, "message": "Would delete"},
+                TimeoutError("Command timed out after 120s"),
+                {"dry_run": True, "success": True, "message": "Would delete"},
+            ]
+
+            result = await client.bulk_delete_sessions(
+                project="test-project", sessions=["s1", "s2", "s3"], dry_run=True
+            )
+
+            assert [info["session"] for info in result["dry_run_info"]["would_execute"]] == ["s1", "s3"]
+            assert result["dry_run_info"]["skipped"] == [{"session": "s2", "reason": "Command timed out after 120s"}]
+
+    @pytest.mark.asyncio
+    async def test_bulk_delete_sessions_dry_run_single_list(self, client: ACPClient) -> None:
+        """Test bulk dry runs look sessions up with one list call."""
+        mock_output = b"s1\t2024-01-20T10:00:00Z\trunning\t\t\ns2\t2024-01-21T10:00:00Z\tstopped\t\t\n"
+
+        with patch.object(
+            client,
+            "_run_oc_command",
+            new_callable=AsyncMock,
+            return_value=MagicMock(returncode=0, stdout=mock_output),
+        ) as mock_cmd:
+            result = await client.bulk_delete_sessions(
+                project="test-project", sessions=["s1", "s2", "s3"], dry_run=True
+            )
+
+            mock_cmd.assert_called_once()
+            would_execute = result["dry_run_info"]["would_execute"]
+            assert [info["session"] for info in would_execute] == ["s1", "s2"]
+            assert would_execute[1]["info"]["status"] == "stopped"
+            assert result["dry_run_info"]["skipped"] == [
+                {"session": "s3", "reason": "Session 's3' not found in project 'test-project'"}
+            ]
+
+    @pytest.mark.asyncio
+    async def test_bulk_stop_sessions(self, client: ACPClient) -> None:
+        """Test bulk session stop."""
+        sessions = ["session-1", "session-2"]
+
+        mock_result = MagicMock(
+            returncode=0,
+            stdout=b"agenticsession.vteam.ambient-code/session-1\nagenticsession.vteam.ambient-code/session-2\n",
+            stderr=b"",
+        )
+
+        with patch.object(client, "_run_oc_command", new_callable=AsyncMock, return_value=mock_result) as mock_run:
             result = await client.bulk_stop_sessions(project="test-project", sessions=sessions)
 
+            mock_run.assert_called_once()
+            assert mock_run.call_args[0][0][0] == "patch"
             assert len(result["stopped"]) == 2
             assert len(result["failed"]) == 0
 
     @pytest.mark.asyncio
     async def test_get_session_logs(self, client: ACPClient) -> None:
-        """Test getting session logs."""
+        """Test getting session logs with a single label-selected oc logs call."""
+        mock_logs = "2024-01-20 10:00:00 INFO Starting session\n2024-01-20 10:00:01 INFO Session ready\n"
+
+        with patch.object(
+            client,
+            "_run_oc_command",
+            new_callable=AsyncMock,
+            return_value=MagicMock(returncode=0, stdout=mock_logs.encode()),
+        ) as mock_cmd:
+            result = await client.get_session_logs(project="test-project", session="test-session", tail_lines=100)
+
+            mock_cmd.assert_called_once()
+            assert mock_cmd.call_args[0][0][:3] == ["logs", "-l", "agenticsession=test-session"]
+            assert "--max-log-requests=1" in mock_cmd.call_args[0][0]
+            assert "--prefix=false" in mock_cmd.call_args[0][0]
+            assert result["logs"] == mock_logs
+            assert result["lines"] == 3  # Including trailing newline
+
+    @pytest.mark.asyncio
+    async def test_get_session_logs_capped_across_pods(self, client: ACPClient) -> None:
+        """Test logs from several matching pods never exceed MAX_LOG_BYTES in total."""
+        client.MAX_LOG_BYTES = 8
+
+        with patch.object(
+            client,
+            "_run_oc_command",
+            new_callable=AsyncMock,
+            return_value=MagicMock(returncode=0, stdout=b"pod-a\npod-b\n"),
+        ):
+            result = await client.get_session_logs(project="test-project", session="test-session")
+
+            assert result["logs"] == "pod-a\npo"
+
+    @pytest.mark.asyncio
+    async def test_get_session_logs_falls_back_to_pod_lookup(self, client: ACPClient) -> None:
+        """Test falling back to looking up the pod when label-selected logs fail."""
         mock_pods = {
             "items": [
                 {
@@ -314,24 +699,55 @@ class TestACPClient:
             ]
         }
 
-        mock_logs = "2024-01-20 10:00:00 INFO Starting session\n2024-01-20 10:00:01 INFO Session ready\n"
-
         with patch.object(
             client,
             "_run_oc_command",
             new_callable=AsyncMock,
         ) as mock_cmd:
-            # First call: get pods
-            # Second call: get logs
+            # First call: logs by label (fails)
+            # Second call: get pods
+            # Third call: get logs
             mock_cmd.side_effect = [
+                MagicMock(returncode=1, stdout=b"", stderr=b"error: unknown flag"),
                 MagicMock(returncode=0, stdout=json.dumps(mock_pods).encode()),
-                MagicMock(returncode=0, stdout=mock_logs.encode()),
+                MagicMock(returncode=0, stdout=b"ready\n"),
             ]
 
-            result = await client.get_session_logs(project="test-project", session="test-session", tail_lines=100)
+            result = await client.get_session_logs(project="test-project", session="test-session")
 
-            assert result["logs"] == mock_logs
-            assert result["lines"] == 3  # Including trailing newline
+            assert mock_cmd.call_args[0][0][:2] == ["logs", "test-session-pod-12345"]
+            assert result["logs"] == "ready\n"
+
+    @pytest.mark.asyncio
+    async def test_get_session_logs_no_pods(self, client: ACPClient) -> None:
+        """Test a session without pods reports an error."""
+        with patch.object(
+            client,
+            "_run_oc_command",
+            new_callable=AsyncMock,
+            return_value=MagicMock(returncode=0, stdout=b"", stderr=b"No resources found in test-project namespace.\n"),
+        ):
+            result = await client.get_session_logs(project="test-project", session="test-session")
+
+            assert "No pods found" in result["error"]
+
+    @pytest.mark.asyncio
+    async def test_create_session_from_template_pipes_manifest(self, client: ACPClient) -> None:
+        """Test the manifest is sent to 'oc create -f -' on stdin."""
+        with patch.object(
+            client,
+            "_run_oc_command",
+            new_callable=AsyncMock,
+            return_value=MagicMock(returncode=0, stdout=b'{"metadata": {"name": "triage-abc12"}}'),
+        ) as mock_cmd:
+            result = await client.create_session_from_template("test-project", "triage", "Triage run")
+
+            assert result["created"] is True
+            assert result["session"] == "triage-abc12"
+            assert mock_cmd.call_args[0][0][:3] == ["create", "-f", "-"]
+            manifest = json.loads(mock_cmd.call_args.kwargs["input"])
+            assert manifest["spec"]["displayName"] == "Triage run"
+            assert manifest["metadata"]["namespace"] == "test-project"
 
     def test_list_clusters(self, client: ACPClient) -> None:
         """Test listing clusters."""
@@ -346,6 +762,48 @@ class TestACPClient:
         assert test_cluster["server"] == "https://api.test.example.com:443"
         assert test_cluster["default_project"] == "test-workspace"
 
+        # The listing is cached and shared, so callers can't modify it
+        with pytest.raises(TypeError):
+            result["clusters"][0]["name"] = "changed"
+        with pytest.raises(AttributeError):
+            result["clusters"].append({})
+
+    def test_list_clusters_after_add_cluster(self, client: ACPClient) -> None:
+        """Test the cluster listing reflects newly added clusters."""
+        assert len(client.list_clusters()["clusters"]) == 2
+
+        result = client.add_cluster("new-cluster", "https://api.new.example.com:443", default_project="new-workspace")
+
+        assert result["added"] is True
+        assert len(client.list_clusters()["clusters"]) == 3
+        assert client._server_to_cluster["https://api.new.example.com:443"] == ("new-cluster", "new-workspace")
+
+    def test_add_cluster_writes_config_securely(self, client: ACPClient) -> None:
+        """Test add_cluster persists the config with 0600 permissions and no leftover temp file."""
+        # A stale, world-readable temp file from an earlier crash must not pass on its mode
+        stale_tmp = Path(client.config_path + ".tmp")
+        stale_tmp.write_text("stale")
+        stale_tmp.chmod(0o644)
+
+        result = client.add_cluster("new-cluster", "https://api.new.example.com:443", default_project="new-workspace")
+
+        assert result["added"] is True
+        config_file = Path(client.config_path)
+        assert config_file.stat().st_mode & 0o777 == 0o600
+        assert not config_file.with_name(config_file.name + ".tmp").exists()
+        saved = yaml.safe_load(config_file.read_text())
+        assert saved["clusters"]["new-cluster"]["default_project"] == "new-workspace"
+
+    def test_default_project_follows_default_cluster(self, client: ACPClient) -> None:
+        """Test default_project is resolved from the default cluster and refreshed by add_cluster."""
+        assert client.default_project == "test-workspace"
+
+        client.add_cluster("new-cluster", "https://api.new.example.com:443", default_project="new-workspace")
+        assert client.default_project == "test-workspace"
+
+        client.add_cluster("other", "https://api.other.example.com:443", default_project="other-ws", set_default=True)
+        assert client.default_project == "other-ws"
+
     @pytest.mark.asyncio
     async def test_whoami(self, client: ACPClient) -> None:
         """Test whoami command."""
@@ -369,6 +827,29 @@ class TestACPClient:
             assert result["project"] == "test-workspace"
             assert result["token_valid"] is True
             assert result["authenticated"] is True
+            assert mock_cmd.call_count == 4
+
+    @pytest.mark.asyncio
+    async def test_whoami_command_failure(self, client: ACPClient) -> None:
+        """Test a failing oc query doesn't abort whoami."""
+        with patch.object(
+            client,
+            "_run_oc_command",
+            new_callable=AsyncMock,
+        ) as mock_cmd:
+            mock_cmd.side_effect = [
+                MagicMock(returncode=0, stdout=b"testuser"),
+                TimeoutError("Command timed out after 120s"),
+                MagicMock(returncode=0, stdout=b"test-workspace"),
+                MagicMock(returncode=1, stdout=b""),
+            ]
+
+            result = await client.whoami()
+
+            assert result["user"] == "testuser"
+            assert result["server"] == "unknown"
+            assert result["token_valid"] is False
+            assert result["authenticated"] is False
 
 
 class TestBulkSafety:
@@ -434,13 +915,11 @@ class TestLabelOperations:
     @pytest.mark.asyncio
     async def test_list_sessions_by_label(self, client: ACPClient) -> None:
         """Should list sessions by label selector."""
-        mock_response = {"items": [{"metadata": {"name": "session-1"}}]}
-
         with patch.object(
             client,
             "_run_oc_command",
             new_callable=AsyncMock,
-            return_value=MagicMock(returncode=0, stdout=json.dumps(mock_response).encode()),
+            return_value=MagicMock(returncode=0, stdout=b"session-1\t\t\t\t\n"),
         ):
             result = await client.list_sessions_by_user_labels("test-project", labels={"env": "dev"})
 
@@ -449,13 +928,13 @@ class TestLabelOperations:
     @pytest.mark.asyncio
     async def test_bulk_delete_by_label_exceeds_limit(self, client: ACPClient) -> None:
         """Should reject when label selector matches >3 sessions."""
-        mock_response = {"items": [{"metadata": {"name": f"s{i}"}} for i in range(5)]}
+        mock_output = "".join(f"s{i}\t\t\t\t\n" for i in range(5)).encode()
 
         with patch.object(
             client,
             "_run_oc_command",
             new_callable=AsyncMock,
-            return_value=MagicMock(returncode=0, stdout=json.dumps(mock_response).encode()),
+            return_value=MagicMock(returncode=0, stdout=mock_output),
         ):
             with pytest.raises(ValueError, match="Max 3 allowed"):
                 await client.bulk_delete_sessions_by_label("test-project", labels={"cleanup": "true"})
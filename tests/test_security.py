@@ -1,5 +1,7 @@
 """Security tests for MCP ACP Server."""
 
+from unittest.mock import AsyncMock, MagicMock, patch
+
 import pytest
 
 from mcp_acp.client import ACPClient
@@ -39,6 +41,7 @@ class TestInputValidation:
             "session&name",  # ampersand
             "-starts-dash",  # starts with dash
             "ends-dash-",  # ends with dash
+            "session\n",  # trailing newline
             "a" * 254,  # too long
         ]
 
@@ -114,6 +117,31 @@ class TestResourceLimits:
         result = await client.get_session_logs("test", "session", tail_lines=-1)
         assert "error" in result
 
+    @pytest.mark.asyncio
+    async def test_get_session_logs_limits_bytes(self):
+        """Test that log retrieval is bounded in bytes, not just lines."""
+        client = ACPClient()
+
+        with (
+            patch.object(
+                client,
+                "_list_resources_json",
+                new_callable=AsyncMock,
+                return_value=[{"metadata": {"name": "session-pod"}}],
+            ),
+            patch.object(
+                client,
+                "_run_oc_command",
+                new_callable=AsyncMock,
+                return_value=MagicMock(returncode=0, stdout=b"partial \xe2\x82"),
+            ) as mock_cmd,
+        ):
+            result = await client.get_session_logs("test", "session")
+
+        args = mock_cmd.call_args[0][0]
+        assert args[args.index("--limit-bytes") + 1] == str(client.MAX_LOG_BYTES)
+        assert result["logs"] == "partial \ufffd"
+
     def test_timeout_constants(self):
         """Test that timeout constants are reasonable."""
         client = ACPClient()
@@ -140,6 +168,7 @@ class TestDataProtection:
             "data:text/html,<script>alert(1)</script>",
             "https://example.com; rm -rf /",
             "https://example.com | cat",
+            "https://example.com/repo\t--upload-pack=evil",
         ]
 
         for url in invalid_urls:
@@ -1,5 +1,8 @@
 """Tests for MCP server."""
 
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -10,9 +13,10 @@ from mcp_acp.formatters import (
     format_logs,
     format_result,
     format_sessions_list,
+    format_transcript,
     format_whoami,
 )
-from mcp_acp.server import call_tool, list_tools
+from mcp_acp.server import call_tool, get_client, get_dispatch_table, list_tools
 
 
 class TestServerFormatters:
@@ -73,6 +77,20 @@ class TestServerFormatters:
         assert "session-2" in output
         assert "running" in output
 
+    def test_format_sessions_list_empty(self) -> None:
+        """Test formatting an empty sessions list."""
+        output = format_sessions_list({"total": 0, "sessions": [], "filters_applied": {"status": "running"}})
+
+        assert output.startswith("Found 0 session(s)\nFilters applied:")
+        assert output.endswith("\n\nNo sessions.\n")
+
+    def test_format_transcript_json_indented(self) -> None:
+        """Test JSON transcripts are pretty-printed."""
+        transcript = [{"role": "user", "content": "hi"}]
+        output = format_transcript({"format": "json", "message_count": 1, "transcript": transcript})
+
+        assert output == "Session Transcript (1 messages):\n\n" + json.dumps(transcript, indent=2)
+
     def testformat_bulk_result_delete_dry_run(self) -> None:
         """Test formatting bulk delete dry run."""
         result = {
@@ -250,6 +268,37 @@ class TestServerTools:
         assert "acp_list_clusters" in tool_names
         assert "acp_whoami" in tool_names
 
+    @pytest.mark.asyncio
+    async def test_list_tools_cached(self) -> None:
+        """Test the tool list is built once and reused."""
+        assert await list_tools() is await list_tools()
+
+    def test_get_client_constructs_once_across_threads(self) -> None:
+        """Test concurrent first calls from several threads build a single client."""
+
+        def slow_client(**kwargs: object) -> MagicMock:
+            time.sleep(0.05)
+            return MagicMock()
+
+        with (
+            patch("mcp_acp.server._client", None),
+            patch("mcp_acp.server.ACPClient", side_effect=slow_client) as mock_cls,
+            ThreadPoolExecutor(max_workers=4) as pool,
+        ):
+            clients = list(pool.map(lambda _: get_client(), range(4)))
+
+        assert mock_cls.call_count == 1
+        assert all(c is clients[0] for c in clients)
+
+    def test_dispatch_table_cached_per_client(self) -> None:
+        """Test the dispatch table is reused for the same client and rebuilt for a new one."""
+        first, second = MagicMock(), MagicMock()
+
+        table = get_dispatch_table(first)
+
+        assert get_dispatch_table(first) is table
+        assert get_dispatch_table(second) is not table
+
     @pytest.mark.asyncio
     async def test_call_tool_delete_session(self) -> None:
         """Test calling delete session tool."""
@@ -333,6 +382,29 @@ class TestServerTools:
             assert len(result) == 1
             assert "Successfully deleted 2 resource(s)" in result[0].text
 
+    @pytest.mark.asyncio
+    async def test_call_tool_bulk_label(self) -> None:
+        """Test calling bulk label tool awaits the client and doesn't forward confirm."""
+        mock_client = MagicMock()
+        mock_client.bulk_label_resources = AsyncMock(return_value={"labeled": ["s1", "s2"], "failed": []})
+
+        with patch("mcp_acp.server.get_client", return_value=mock_client):
+            result = await call_tool(
+                "acp_bulk_label_resources",
+                {
+                    "project": "test-project",
+                    "resource_type": "agenticsession",
+                    "names": ["s1", "s2"],
+                    "labels": {"env": "dev"},
+                    "confirm": True,
+                },
+            )
+
+            assert "2 resource(s)" in result[0].text
+            mock_client.bulk_label_resources.assert_awaited_once_with(
+                project="test-project", resource_type="agenticsession", names=["s1", "s2"], labels={"env": "dev"}
+            )
+
     @pytest.mark.asyncio
     async def test_call_tool_bulk_stop(self) -> None:
         """Test calling bulk stop tool."""